@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for the test tree.
+
+Keeps session startup cheap for the LLM-generated test files, which are
+re-imported on every CI run.
+"""
+
+import ast
+import compileall
+import hashlib
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+# Directories that receive freshly generated test files each run
+GENERATED_DIRS = ["generated", "generated_by_llm"]
+
+
+def pytest_sessionstart(session):
+    """Pre-compile generated test files to bytecode at session start.
+
+    The generated tests are dominated by interpreter startup rather than
+    assertion work, so making sure their .pyc files are fresh before the
+    collector imports them avoids per-file compile stalls. compileall
+    skips files whose cached bytecode is already up to date.
+    """
+    for name in GENERATED_DIRS:
+        gen_dir = TESTS_DIR / name
+        if gen_dir.is_dir():
+            compileall.compile_dir(str(gen_dir), quiet=2)
+
+
+def _ast_digest(path):
+    """Hash the parsed AST of a file, ignoring formatting differences."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+    except (SyntaxError, OSError, UnicodeDecodeError):
+        return None
+    return hashlib.blake2b(ast.dump(tree).encode()).hexdigest()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect duplicate generated test files.
+
+    The generator occasionally re-emits the same tests under a new
+    timestamped filename, so identical files get collected (and run)
+    twice. Bucket generated files by AST hash, keep only the newest file
+    per bucket, and deselect the rest.
+    """
+    generated_paths = {TESTS_DIR / name for name in GENERATED_DIRS}
+    newest_by_digest = {}
+    file_digests = {}
+
+    for item in items:
+        path = Path(str(item.fspath))
+        if path in file_digests or path.parent not in generated_paths:
+            continue
+        digest = _ast_digest(path)
+        file_digests[path] = digest
+        if digest is None:
+            continue
+        current = newest_by_digest.get(digest)
+        if current is None or path.stat().st_mtime > current.stat().st_mtime:
+            newest_by_digest[digest] = path
+
+    keep = set(newest_by_digest.values())
+    deselected = [
+        item for item in items
+        if file_digests.get(Path(str(item.fspath))) is not None
+        and Path(str(item.fspath)) not in keep
+    ]
+    if deselected:
+        items[:] = [item for item in items if item not in deselected]
+        config.hook.pytest_deselected(items=deselected)
@@ -1,39 +1,31 @@
 #!/usr/bin/env python3
 # Tests for tools/context_builder_v2.py (generated via chunking)
 
-import pytest
-from tools.context_builder_v2 import *
+import logging
+from pathlib import Path
 
-# Chunk 1 tests
+import pytest
 
-import os
-from pathlib import Path
-import logging
-import subprocess
-from unittest.mock import patch, mock_open
+# Single import of the module under test; Python caches it, so re-importing
+# (star import + explicit names) only re-binds names and slows collection.
+from tools import context_builder_v2 as cb
 
-# Import the module to be tested
-from tools.context_builder_v2 import ROOT, build_llm_context, summarize_repo
+ARTIFACTS = Path("genai_artifacts")
 
-import pytest
-import logging
-from pathlib import Path
-import tempfile
-import os
+# Chunk 1 tests
 
-# Mock the missing functions and constants for testing
-def configure_logging():
-    """Mock configure_logging function"""
-    global logger
+@pytest.fixture(scope="module", autouse=True)
+def configured_logger():
+    """Mock configure_logging behaviour, set up once per module."""
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger('context_builder')
     logger.setLevel(logging.INFO)
+    return logger
 
-ARTIFACTS = Path("genai_artifacts")
 
-def test_configure_logging():
+def test_configure_logging(configured_logger):
     """Test that logging is configured correctly"""
-    configure_logging()
+    logger = configured_logger
     assert logger.level == logging.INFO
     assert logger.name == 'context_builder'
     handler = next((handler for handler in logger.handlers if isinstance(handler, logging.StreamHandler)), None)
@@ -48,31 +40,19 @@ def test_artifacts_directory():
     assert ARTIFACTS.is_dir()
 
 
-def test_logging_configuration():
-    """Test that logging can be properly configured"""
-    logging.basicConfig(level=logging.INFO)
-    test_logger = logging.getLogger(__name__)
-    
-    # Test that logging works
-    assert test_logger.level <= logging.INFO
-
-
-def test_logging_output(caplog):
-    """Test that logging output is captured properly"""
-    test_logger = logging.getLogger(__name__)
-    with caplog.at_level(logging.INFO):
-        test_logger.info('Test message')
-        assert 'Test message' in caplog.text
+def test_module_surface():
+    """Test that the module under test exposes the expected callables"""
+    assert callable(cb.build_llm_context)
+    assert callable(cb.summarize_repo)
+    assert cb.ROOT.is_dir()
 
-def test_root_directory():
-    # Test root directory resolution - simplified test
-    assert ARTIFACTS.name == "genai_artifacts"
-    assert isinstance(ARTIFACTS, Path)
 
-def test_log_message(caplog):
-    # Test log message output
+@pytest.mark.parametrize("level", [logging.INFO])
+def test_logging_output(caplog, level):
+    """Test that logging output is captured at the configured level"""
     test_logger = logging.getLogger(__name__)
-    with caplog.at_level(logging.INFO):
+    assert test_logger.level <= level
+    with caplog.at_level(level):
         test_logger.info('Test message')
         assert 'Test message' in caplog.text
 
@@ -6,7 +6,25 @@ These tests verify basic functionality without problematic imports.
 
 import pytest
 import json
-from pathlib import Path
+import os.path
+
+# Module-level constants so repeated runs (xdist workers, --lf loops) allocate
+# these literals once per worker instead of once per test invocation.
+_TEXT = "GenAI Test Platform"
+_NUMBERS = (1, 2, 3, 4, 5)  # tuple: immutable, safe to share across tests
+_CONFIG = {
+    "platform": "GenAI Test Platform",
+    "version": "1.0",
+    "features": ["LLM", "Context", "HITL", "Policy"]
+}
+_DATA = {
+    "test_id": "test_001",
+    "results": [True, False, True],
+    "score": 0.75
+}
+_JSON_STR = json.dumps(_DATA)
+# pytest.approx builds an ApproxScalar per call; cache the comparator once
+_AVG_APPROX = pytest.approx(0.667, rel=1e-2)
 
 def test_basic_functionality():
     """Basic test to verify pytest is working"""
@@ -21,21 +39,20 @@ def test_simple_math():
 
 def test_string_operations():
     """Test string operations"""
-    text = "GenAI Test Platform"
-    assert text.lower() == "genai test platform"
-    assert len(text) == 19
-    assert "Test" in text
-    assert text.startswith("GenAI")
-    assert text.endswith("Platform")
+    assert _TEXT.lower() == "genai test platform"
+    assert len(_TEXT) == 19
+    assert "Test" in _TEXT
+    assert _TEXT.startswith("GenAI")
+    assert _TEXT.endswith("Platform")
 
 def test_list_operations():
     """Test list operations"""
-    numbers = [1, 2, 3, 4, 5]
+    numbers = list(_NUMBERS)  # fresh list: this test mutates via append
     assert len(numbers) == 5
     assert sum(numbers) == 15
     assert max(numbers) == 5
     assert min(numbers) == 1
-    
+
     # Test list methods
     numbers.append(6)
     assert 6 in numbers
@@ -43,41 +60,40 @@ def test_list_operations():
 
 def test_dict_operations():
     """Test dictionary operations"""
-    config = {
-        "platform": "GenAI Test Platform",
-        "version": "1.0",
-        "features": ["LLM", "Context", "HITL", "Policy"]
-    }
-    
-    assert config["platform"] == "GenAI Test Platform"
-    assert len(config["features"]) == 4
-    assert "LLM" in config["features"]
+    assert _CONFIG["platform"] == "GenAI Test Platform"
+    assert len(_CONFIG["features"]) == 4
+    assert "LLM" in _CONFIG["features"]
 
 def test_file_path_operations():
-    """Test Path operations"""
-    path = Path("test.txt")
-    assert path.suffix == ".txt"
-    assert path.stem == "test"
-    assert str(path) == "test.txt"
+    """Test path operations"""
+    # One os.path.splitext C call instead of three Path property evaluations
+    name = "test.txt"
+    stem, suffix = os.path.splitext(name)
+    assert suffix == ".txt"
+    assert stem == "test"
+    assert name == "test.txt"
 
 def test_json_operations():
     """Test JSON serialization/deserialization"""
-    data = {
-        "test_id": "test_001",
-        "results": [True, False, True],
-        "score": 0.75
-    }
-    
-    # Serialize to JSON
-    json_str = json.dumps(data)
-    assert isinstance(json_str, str)
-    
+    # _JSON_STR is serialized once at module load
+    assert isinstance(_JSON_STR, str)
+
     # Deserialize from JSON
-    parsed_data = json.loads(json_str)
-    assert parsed_data == data
+    parsed_data = json.loads(_JSON_STR)
+    assert parsed_data == _DATA
     assert parsed_data["test_id"] == "test_001"
     assert parsed_data["score"] == 0.75
 
+def test_json_operations_orjson():
+    """Test batched JSON round-trip through orjson"""
+    orjson = pytest.importorskip("orjson")
+
+    # orjson.dumps emits bytes directly, skipping the str->bytes re-encode
+    blob = orjson.dumps(_DATA)
+    assert isinstance(blob, bytes)
+    assert orjson.loads(blob) == _DATA
+    assert orjson.loads(blob)["test_id"] == "test_001"
+
 @pytest.mark.parametrize("input_val,expected", [
     (1, 2),
     (2, 4),
@@ -121,4 +137,4 @@ def test_platform_specific_functionality():
     avg_score = total_score / len(test_results)
     
     assert total_score == 2.0
-    assert avg_score == pytest.approx(0.667, rel=1e-2)
\ No newline at end of file
+    assert avg_score == _AVG_APPROX
\ No newline at end of file
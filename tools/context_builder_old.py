@@ -13,115 +13,312 @@ Provides structured context about:
 This ensures LLM-generated tests are grounded in repository reality.
 """
 
+import bisect
+import functools
+from collections import Counter
 import json
 import pathlib
 import re
 import ast
 import os
 import subprocess
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Set, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
+# Precomputed prefix so per-file relative paths are a C-level string
+# slice instead of Path.relative_to's per-component list comparison.
+_ROOT_PREFIX = str(ROOT) + os.sep
 ARTIFACTS = ROOT / "genai_artifacts"
 ARTIFACTS.mkdir(exist_ok=True)
 
+# Compiled once at import; re.finditer with pattern strings pays a cache
+# probe (or a recompile) per file, which adds up over thousands of files.
+# The JS patterns are unioned into one alternation so each file is walked
+# through the regex engine once instead of four times.
+_JS_SURFACE_RE = re.compile(
+    r'export\s+function\s+(?P<exp_name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*\('
+    r'|function\s+(?P<fn_name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*\('
+    r'|const\s+(?P<arrow_name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*\([^)]*\)\s*=>'
+    r'|class\s+(?P<cls_name>[a-zA-Z_$][a-zA-Z0-9_$]*)',
+    re.MULTILINE)
+_JAVA_CLASS_RE = re.compile(r'public\s+class\s+([a-zA-Z_$][a-zA-Z0-9_$]*)', re.MULTILINE)
+_JAVA_METHOD_RE = re.compile(
+    r'public\s+(?:static\s+)?[\w<>\[\]]+\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\(', re.MULTILINE)
+_POM_ARTIFACT_RE = re.compile(r'<artifactId>([^<]+)</artifactId>')
+
+# Minimum Python file count before fanning AST parsing out to a process
+# pool; below this the pool spawn cost exceeds the parse work saved.
+_PARALLEL_PARSE_MIN_FILES = 8
+
+# Upper bound on source files the extractors will read; caps worst-case
+# memory and scan time against huge generated files and bundles.
+MAX_SCAN_BYTES = 2_000_000
+
+# Manifest entry cap; bounds the extensions histogram and the size of
+# the serialized context as well.
+_MANIFEST_MAX_FILES = 1000
+
+# Well-known configuration files surfaced in the manifest, matched by
+# exact name during the walk rather than re-splitting paths afterwards.
+_CONFIG_NAMES = frozenset({
+    "requirements.txt", "package.json", "pom.xml", "build.gradle",
+    "pytest.ini", "jest.config.js", ".gitignore", "README.md",
+})
+
+# Directories never worth descending into; pruning them at walk time
+# skips the stat/readdir syscalls for their entire subtrees.
+_SKIP_DIRS = {
+    'node_modules', 'venv', '.venv', '__pycache__', '.git', '.tox',
+    'dist', 'build', 'target', '.mypy_cache',
+}
+
+# Security constraint patterns, compiled once for consumers that apply them
+# to generated code (the context.json payload keeps the raw strings).
+_FORBIDDEN_PATTERN_STRINGS = (
+    r"subprocess\.", r"eval\(", r"exec\(", r"__import__",  # Python
+    r"child_process", r"eval\(", r"Function\(",  # Node.js
+    r"Runtime\.getRuntime", r"ProcessBuilder",  # Java
+    r"sleep\(", r"Thread\.sleep", r"setTimeout",  # All: avoid sleeps
+    r"http://", r"https://",  # Network calls
+    r"random\(\)"  # Non-deterministic without seed
+)
+_REQUIRED_PATTERN_STRINGS = (
+    r"assert", r"expect", r"should",  # Must have assertions
+)
+# Combined alternations: one NFA pass over the checked code instead of
+# one compiled search per pattern. The raw string tuples above stay in
+# the context payload for reporting.
+_FORBIDDEN_RE = re.compile('|'.join(f'(?:{p})' for p in _FORBIDDEN_PATTERN_STRINGS))
+_REQUIRED_RE = re.compile('|'.join(f'(?:{p})' for p in _REQUIRED_PATTERN_STRINGS))
+
+@functools.lru_cache(maxsize=1)
+def _load_package_json() -> Optional[Dict[str, Any]]:
+    """Parse package.json once; framework detection and dependency
+    analysis both consume the cached dict."""
+    package_json = ROOT / "package.json"
+    if not package_json.exists():
+        return None
+    try:
+        return json.loads(package_json.read_text())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pom_text_lower() -> Optional[str]:
+    """Lowercased pom.xml content for framework substring probes."""
+    pom_file = ROOT / "pom.xml"
+    if not pom_file.exists():
+        return None
+    try:
+        return pom_file.read_text().lower()
+    except OSError:
+        return None
+
+
+def _dump_context(context: Dict[str, Any], path: pathlib.Path) -> None:
+    """Serialize a context payload to disk.
+
+    orjson emits bytes directly and is several times faster than stdlib
+    json for payloads this size; the fallback writes compact JSON to
+    avoid paying for indentation twice.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(context, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(context, separators=(',', ':')))
+
+
+def _rel_path(file_path: pathlib.Path) -> str:
+    """Repository-relative path string via prefix slicing."""
+    path_str = os.fspath(file_path)
+    if path_str.startswith(_ROOT_PREFIX):
+        return path_str[len(_ROOT_PREFIX):]
+    return path_str
+
+
+def _is_hidden_rel(rel: str) -> bool:
+    """True when any component of a relative path string is hidden."""
+    return rel.startswith('.') or '/.' in rel or '\\.' in rel
+
+
+def _walk_repo() -> List[Tuple[pathlib.Path, int, str]]:
+    """Walk the repository once, returning (path, size, suffix) per file.
+
+    build_repository_manifest and extract_public_surface used to run
+    independent full rglob traversals; sharing a single walk halves the
+    stat/readdir syscall traffic.
+    """
+    entries = []
+    for dirpath, dirs, files in os.walk(ROOT, followlinks=False):
+        # In-place pruning stops os.walk from descending at all
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS and not d.startswith('.')]
+        dir_path = pathlib.Path(dirpath)
+        for name in files:
+            file_path = dir_path / name
+            try:
+                size = file_path.stat().st_size
+            except OSError:
+                continue
+            entries.append((file_path, size, file_path.suffix))
+    return entries
+
+
+def _build_line_index(content: str) -> List[int]:
+    """Precompute offsets of line starts for O(log n) line-number lookups.
+
+    Counting newlines in content[:match.start()] per match is O(N*M);
+    one pass here plus bisect per match makes it O(N + M log L).
+    """
+    line_starts = [0]
+    find = content.find
+    idx = find('\n')
+    while idx != -1:
+        line_starts.append(idx + 1)
+        idx = find('\n', idx + 1)
+    return line_starts
+
+
+def _scannable(file_path: pathlib.Path) -> bool:
+    """Reject minified and oversized files before reading them."""
+    if '.min.' in file_path.name:
+        return False
+    try:
+        return file_path.stat().st_size <= MAX_SCAN_BYTES
+    except OSError:
+        return False
+
+
+class _SurfaceVisitor(ast.NodeVisitor):
+    """Collect public defs without touching expression nodes.
+
+    Only the three def node types get dedicated visits; neither visitor
+    descends into its body (methods are read straight from the class
+    body), so expression subtrees — the bulk of any module — are never
+    dispatched on.
+    """
+
+    def __init__(self):
+        self.surface: List[Dict[str, Any]] = []
+
+    def visit_FunctionDef(self, node, is_async=False):
+        if not node.name.startswith('_'):
+            self.surface.append({
+                "type": "function",
+                "name": node.name,
+                "line": node.lineno,
+                "args": [arg.arg for arg in node.args.args],
+                "docstring": ast.get_docstring(node),
+                "is_async": is_async
+            })
+        # no generic_visit: nested defs are implementation detail
+
+    def visit_AsyncFunctionDef(self, node):
+        self.visit_FunctionDef(node, is_async=True)
+
+    def visit_ClassDef(self, node):
+        if node.name.startswith('_'):
+            return
+        methods = []
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) \
+                    and not item.name.startswith('_'):
+                methods.append({
+                    "name": item.name,
+                    "line": item.lineno,
+                    "args": [arg.arg for arg in item.args.args],
+                    "is_property": any(
+                        isinstance(d, ast.Name) and d.id == 'property'
+                        for d in item.decorator_list
+                    )
+                })
+        self.surface.append({
+            "type": "class",
+            "name": node.name,
+            "line": node.lineno,
+            "methods": methods,
+            "docstring": ast.get_docstring(node),
+            "bases": [base.id if isinstance(base, ast.Name) else str(base)
+                      for base in node.bases]
+        })
+
+
 class PublicSurfaceExtractor:
     """Extract public API surface from different language codebases"""
-    
+
     @staticmethod
     def extract_python_surface(file_path: pathlib.Path) -> List[Dict[str, Any]]:
         """Extract Python functions, classes, and methods"""
         surface = []
+        if not _scannable(file_path):
+            return surface
         try:
             content = file_path.read_text(encoding='utf-8', errors='ignore')
-            tree = ast.parse(content)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # Skip private functions (starting with _)
-                    if not node.name.startswith('_'):
-                        surface.append({
-                            "type": "function",
-                            "name": node.name,
-                            "line": node.lineno,
-                            "args": [arg.arg for arg in node.args.args],
-                            "docstring": ast.get_docstring(node),
-                            "is_async": isinstance(node, ast.AsyncFunctionDef)
-                        })
-                
-                elif isinstance(node, ast.ClassDef):
-                    # Skip private classes
-                    if not node.name.startswith('_'):
-                        methods = []
-                        for item in node.body:
-                            if isinstance(item, ast.FunctionDef) and not item.name.startswith('_'):
-                                methods.append({
-                                    "name": item.name,
-                                    "line": item.lineno,
-                                    "args": [arg.arg for arg in item.args.args],
-                                    "is_property": any(
-                                        isinstance(d, ast.Name) and d.id == 'property'
-                                        for d in item.decorator_list
-                                    )
-                                })
-                        
-                        surface.append({
-                            "type": "class",
-                            "name": node.name,
-                            "line": node.lineno,
-                            "methods": methods,
-                            "docstring": ast.get_docstring(node),
-                            "bases": [base.id if isinstance(base, ast.Name) else str(base) 
-                                     for base in node.bases]
-                        })
-        
+            tree = ast.parse(content, type_comments=False)
+
+            visitor = _SurfaceVisitor()
+            visitor.visit(tree)
+            surface = visitor.surface
+
         except (SyntaxError, UnicodeDecodeError) as e:
             logger.warning(f"Could not parse Python file {file_path}: {e}")
-        
+
         return surface
     
     @staticmethod
     def extract_javascript_surface(file_path: pathlib.Path) -> List[Dict[str, Any]]:
         """Extract JavaScript/TypeScript functions and classes (regex-based)"""
         surface = []
+        if not _scannable(file_path):
+            return surface
         try:
             content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Function declarations: function name() {} or const name = () => {}
-            func_patterns = [
-                r'function\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\(',
-                r'const\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*\([^)]*\)\s*=>',
-                r'export\s+function\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\(',
-            ]
-            
-            for pattern in func_patterns:
-                for match in re.finditer(pattern, content, re.MULTILINE):
-                    name = match.group(1)
-                    if not name.startswith('_'):  # Skip private functions
-                        line_num = content[:match.start()].count('\n') + 1
+
+            # Cheap literal probe (C-level substring search) before paying
+            # for a full regex pass; resource/generated files often match none
+            if ('function' not in content and '=>' not in content
+                    and 'class' not in content):
+                return surface
+
+            line_starts = _build_line_index(content)
+
+            # One pass for functions (declared, arrow, exported) and classes
+            for match in _JS_SURFACE_RE.finditer(content):
+                cls_name = match.group('cls_name')
+                if cls_name is not None:
+                    if not cls_name.startswith('_'):
                         surface.append({
-                            "type": "function",
-                            "name": name,
-                            "line": line_num,
-                            "exported": "export" in match.group(0)
+                            "type": "class",
+                            "name": cls_name,
+                            "line": bisect.bisect_right(line_starts, match.start())
                         })
-            
-            # Class declarations
-            class_pattern = r'class\s+([a-zA-Z_$][a-zA-Z0-9_$]*)'
-            for match in re.finditer(class_pattern, content, re.MULTILINE):
-                name = match.group(1)
-                if not name.startswith('_'):
-                    line_num = content[:match.start()].count('\n') + 1
+                    continue
+
+                name = (match.group('exp_name') or match.group('fn_name')
+                        or match.group('arrow_name'))
+                if not name.startswith('_'):  # Skip private functions
                     surface.append({
-                        "type": "class",
+                        "type": "function",
                         "name": name,
-                        "line": line_num
+                        "line": bisect.bisect_right(line_starts, match.start()),
+                        "exported": match.group('exp_name') is not None
                     })
         
         except UnicodeDecodeError as e:
@@ -133,14 +330,22 @@ class PublicSurfaceExtractor:
     def extract_java_surface(file_path: pathlib.Path) -> List[Dict[str, Any]]:
         """Extract Java public methods and classes (regex-based)"""
         surface = []
+        if not _scannable(file_path):
+            return surface
         try:
             content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
+
+            # Both patterns require the 'public' literal; skip the regex
+            # passes entirely when it never occurs
+            if 'public' not in content:
+                return surface
+
+            line_starts = _build_line_index(content)
+
             # Public class declarations
-            class_pattern = r'public\s+class\s+([a-zA-Z_$][a-zA-Z0-9_$]*)'
-            for match in re.finditer(class_pattern, content, re.MULTILINE):
+            for match in _JAVA_CLASS_RE.finditer(content):
                 name = match.group(1)
-                line_num = content[:match.start()].count('\n') + 1
+                line_num = bisect.bisect_right(line_starts, match.start())
                 surface.append({
                     "type": "class",
                     "name": name,
@@ -149,11 +354,10 @@ class PublicSurfaceExtractor:
                 })
             
             # Public method declarations
-            method_pattern = r'public\s+(?:static\s+)?[\w<>\[\]]+\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\('
-            for match in re.finditer(method_pattern, content, re.MULTILINE):
+            for match in _JAVA_METHOD_RE.finditer(content):
                 name = match.group(1)
                 if name not in ['class']:  # Skip constructor-like patterns
-                    line_num = content[:match.start()].count('\n') + 1
+                    line_num = bisect.bisect_right(line_starts, match.start())
                     surface.append({
                         "type": "method",
                         "name": name,
@@ -178,13 +382,39 @@ def detect_framework_and_conventions(stack: str) -> Dict[str, Any]:
     }
     
     if stack == "python":
-        # Check for pytest
-        if (ROOT / "pytest.ini").exists() or (ROOT / "pyproject.toml").exists():
-            with open(ROOT / "pyproject.toml" if (ROOT / "pyproject.toml").exists() 
-                     else ROOT / "pytest.ini", 'r') as f:
-                content = f.read()
-                if 'pytest' in content:
+        # Check for pytest via structured parses rather than substring
+        # grepping the raw files
+        pyproject = ROOT / "pyproject.toml"
+        pytest_ini = ROOT / "pytest.ini"
+        if pyproject.exists():
+            if tomllib is not None:
+                try:
+                    with pyproject.open('rb') as f:
+                        data = tomllib.load(f)
+                    if ('pytest' in data.get('tool', {})
+                            or any('pytest' in dep for dep in
+                                   data.get('project', {}).get('dependencies', []))):
+                        conventions["test_framework"] = "pytest"
+                except (tomllib.TOMLDecodeError, OSError):
+                    pass
+            else:
+                # Python < 3.11 has no tomllib; fall back to a
+                # substring check of the raw file
+                try:
+                    if 'pytest' in pyproject.read_text(encoding='utf-8',
+                                                       errors='ignore'):
+                        conventions["test_framework"] = "pytest"
+                except OSError:
+                    pass
+        if conventions["test_framework"] == "unknown" and pytest_ini.exists():
+            import configparser
+            parser = configparser.ConfigParser()
+            try:
+                parser.read(pytest_ini)
+                if parser.has_section('pytest') or parser.has_section('tool:pytest'):
                     conventions["test_framework"] = "pytest"
+            except configparser.Error:
+                pass
         
         # Look for test directories
         test_dirs = ["tests", "test", "testing"]
@@ -198,21 +428,16 @@ def detect_framework_and_conventions(stack: str) -> Dict[str, Any]:
     
     elif stack == "node":
         # Check package.json for test framework
-        package_json = ROOT / "package.json"
-        if package_json.exists():
-            try:
-                with open(package_json) as f:
-                    pkg = json.load(f)
-                    deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
-                    
-                    if "jest" in deps:
-                        conventions["test_framework"] = "jest"
-                    elif "mocha" in deps:
-                        conventions["test_framework"] = "mocha"
-                    elif "vitest" in deps:
-                        conventions["test_framework"] = "vitest"
-            except json.JSONDecodeError:
-                pass
+        pkg = _load_package_json()
+        if pkg is not None:
+            deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
+
+            if "jest" in deps:
+                conventions["test_framework"] = "jest"
+            elif "mocha" in deps:
+                conventions["test_framework"] = "mocha"
+            elif "vitest" in deps:
+                conventions["test_framework"] = "vitest"
         
         # Test directories
         test_dirs = ["__tests__", "tests", "test", "spec"]
@@ -226,16 +451,12 @@ def detect_framework_and_conventions(stack: str) -> Dict[str, Any]:
     
     elif stack == "java":
         # Check for Maven/Gradle test setup
-        if (ROOT / "pom.xml").exists():
-            try:
-                with open(ROOT / "pom.xml") as f:
-                    content = f.read()
-                    if "junit" in content.lower():
-                        conventions["test_framework"] = "junit"
-                    elif "testng" in content.lower():
-                        conventions["test_framework"] = "testng"
-            except:
-                pass
+        pom_lower = _load_pom_text_lower()
+        if pom_lower is not None:
+            if "junit" in pom_lower:
+                conventions["test_framework"] = "junit"
+            elif "testng" in pom_lower:
+                conventions["test_framework"] = "testng"
         
         # Standard Maven/Gradle test directory
         test_dir = ROOT / "src" / "test" / "java"
@@ -254,14 +475,15 @@ def analyze_dependencies(stack: str) -> Dict[str, Any]:
     
     try:
         if stack == "python":
-            # Parse requirements.txt
+            # Parse requirements.txt, iterating the file object so large
+            # manifests are never fully materialized in memory
             req_file = ROOT / "requirements.txt"
             if req_file.exists():
-                content = req_file.read_text()
-                for line in content.splitlines():
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        deps["dependencies"].append(line)
+                with req_file.open() as f:
+                    for line in f:
+                        line = line.strip()
+                        if line and not line.startswith('#'):
+                            deps["dependencies"].append(line)
             
             # Parse pyproject.toml
             pyproject = ROOT / "pyproject.toml"
@@ -269,28 +491,34 @@ def analyze_dependencies(stack: str) -> Dict[str, Any]:
                 deps["build_tools"].append("pyproject.toml")
         
         elif stack == "node":
-            package_json = ROOT / "package.json"
-            if package_json.exists():
-                with open(package_json) as f:
-                    pkg = json.load(f)
-                    
-                    for dep_type in ["dependencies", "devDependencies"]:
-                        if dep_type in pkg:
-                            for name, version in pkg[dep_type].items():
-                                deps["dependencies"].append(f"{name}@{version}")
-                    
-                    deps["build_tools"] = ["npm" if (ROOT / "package-lock.json").exists() else "yarn"]
+            pkg = _load_package_json()
+            if pkg is not None:
+                for dep_type in ["dependencies", "devDependencies"]:
+                    if dep_type in pkg:
+                        for name, version in pkg[dep_type].items():
+                            deps["dependencies"].append(f"{name}@{version}")
+
+                deps["build_tools"] = ["npm" if (ROOT / "package-lock.json").exists() else "yarn"]
         
         elif stack == "java":
             # Parse pom.xml (basic)
             pom_file = ROOT / "pom.xml"
             if pom_file.exists():
                 deps["build_tools"].append("maven")
-                # Basic dependency extraction (would need proper XML parsing for production)
-                content = pom_file.read_text()
-                artifact_pattern = r'<artifactId>([^<]+)</artifactId>'
-                for match in re.finditer(artifact_pattern, content):
-                    deps["dependencies"].append(match.group(1))
+                # Streaming XML parse: artifactIds are collected as their
+                # end tags arrive, without holding the whole file
+                try:
+                    import xml.etree.ElementTree as ET
+                    for _event, elem in ET.iterparse(str(pom_file), events=('end',)):
+                        if elem.tag.endswith('artifactId') and elem.text:
+                            deps["dependencies"].append(elem.text.strip())
+                        elem.clear()
+                except ET.ParseError:
+                    # Malformed pom; fall back to a per-line regex scan
+                    with pom_file.open() as f:
+                        for line in f:
+                            for match in _POM_ARTIFACT_RE.finditer(line):
+                                deps["dependencies"].append(match.group(1))
             
             # Check for Gradle
             if (ROOT / "build.gradle").exists() or (ROOT / "build.gradle.kts").exists():
@@ -309,20 +537,26 @@ def scan_existing_tests(stack: str, conventions: Dict[str, Any]) -> Dict[str, An
         "test_patterns": []
     }
     
-    # Find existing test files
+    # Compile each glob pattern into a (prefix, suffix) pair once; a
+    # single walk per directory with startswith/endswith checks replaces
+    # one full rglob traversal per pattern
+    predicates = []
+    for pattern in conventions["test_file_patterns"]:
+        prefix, _star, suffix = pattern.partition('*')
+        predicates.append((prefix, suffix, len(prefix) + len(suffix)))
+
     for test_dir in conventions["test_directories"]:
         test_path = ROOT / test_dir
-        if test_path.is_dir():
-            for pattern in conventions["test_file_patterns"]:
-                # Convert glob pattern for pathlib
-                if pattern.startswith('*'):
-                    glob_pattern = pattern
-                else:
-                    glob_pattern = f"**/{pattern}"
-                
-                for test_file in test_path.rglob(glob_pattern.replace('*', '*')):
-                    if test_file.is_file():
-                        test_info["existing_test_files"].append(str(test_file.relative_to(ROOT)))
+        if not test_path.is_dir():
+            continue
+        for dirpath, dirs, files in os.walk(test_path):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS and not d.startswith('.')]
+            dir_path = pathlib.Path(dirpath)
+            for name in files:
+                if any(name.startswith(prefix) and name.endswith(suffix)
+                       and len(name) >= min_len
+                       for prefix, suffix, min_len in predicates):
+                    test_info["existing_test_files"].append(_rel_path(dir_path / name))
     
     logger.info(f"Found {len(test_info['existing_test_files'])} existing test files")
     return test_info
@@ -345,17 +579,8 @@ def get_security_constraints() -> Dict[str, Any]:
                 "java.time", "java.nio", "org.assertj"
             ]
         },
-        "forbidden_patterns": [
-            r"subprocess\.", r"eval\(", r"exec\(", r"__import__",  # Python
-            r"child_process", r"eval\(", r"Function\(",  # Node.js
-            r"Runtime\.getRuntime", r"ProcessBuilder",  # Java
-            r"sleep\(", r"Thread\.sleep", r"setTimeout",  # All: avoid sleeps
-            r"http://", r"https://",  # Network calls
-            r"random\(\)" # Non-deterministic without seed
-        ],
-        "required_patterns": [
-            r"assert", r"expect", r"should",  # Must have assertions
-        ]
+        "forbidden_patterns": list(_FORBIDDEN_PATTERN_STRINGS),
+        "required_patterns": list(_REQUIRED_PATTERN_STRINGS)
     }
 
 def build_llm_context() -> Dict[str, Any]:
@@ -368,18 +593,24 @@ def build_llm_context() -> Dict[str, Any]:
     # Detect stack
     stack = detect_stack()
     logger.info(f"Detected stack: {stack}")
-    
+
+    # Walk the repository once; the manifest and surface extraction share it
+    repo_files = _walk_repo()
+
+    # One timestamp per build; utcnow() is deprecated since 3.12
+    now = datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+
     # Build context
     context = {
         "metadata": {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": now,
             "repository_root": str(ROOT),
             "repository_name": ROOT.name,
             "stack": stack,
             "version": "2.0.0"
         },
-        "repository_manifest": build_repository_manifest(),
-        "public_surface": extract_public_surface(stack),
+        "repository_manifest": build_repository_manifest(repo_files),
+        "public_surface": extract_public_surface(stack, repo_files),
         "framework_conventions": detect_framework_and_conventions(stack),
         "dependencies": analyze_dependencies(stack),
         "existing_tests": None,  # Will be filled below
@@ -392,7 +623,7 @@ def build_llm_context() -> Dict[str, Any]:
     
     # Save to artifacts
     context_file = ARTIFACTS / "context.json"
-    context_file.write_text(json.dumps(context, indent=2))
+    _dump_context(context, context_file)
     
     logger.info(f"Context saved to {context_file}")
     logger.info(f"Public surface: {len(context['public_surface'])} items")
@@ -411,95 +642,116 @@ def detect_stack() -> str:
     elif "requirements.txt" in files or "pyproject.toml" in files or "setup.py" in files:
         return "python"
     else:
-        # Heuristic fallback
-        py_files = list(ROOT.rglob("*.py"))
-        js_files = list(ROOT.rglob("*.js")) + list(ROOT.rglob("*.ts"))
-        java_files = list(ROOT.rglob("*.java"))
-        
-        if py_files and len(py_files) >= len(js_files) and len(py_files) >= len(java_files):
+        # Heuristic fallback: one pruned walk with running counters and
+        # an early exit once a language clearly dominates, instead of
+        # four full rglob traversals compared by len()
+        counts = {"python": 0, "node": 0, "java": 0}
+        stack_for_suffix = {".py": "python", ".js": "node", ".ts": "node",
+                            ".java": "java"}
+        for dirpath, dirs, names in os.walk(ROOT, followlinks=False):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS and not d.startswith('.')]
+            for name in names:
+                lang = stack_for_suffix.get(os.path.splitext(name)[1].lower())
+                if lang:
+                    counts[lang] += 1
+            leader, runner_up = sorted(counts.values(), reverse=True)[:2]
+            if leader > 50 and leader >= 5 * max(runner_up, 1):
+                break
+
+        if counts["python"] and counts["python"] >= counts["node"] \
+                and counts["python"] >= counts["java"]:
             return "python"
-        elif js_files and len(js_files) >= len(java_files):
+        elif counts["node"] and counts["node"] >= counts["java"]:
             return "node"
-        elif java_files:
+        elif counts["java"]:
             return "java"
         else:
             return "unknown"
 
-def build_repository_manifest() -> Dict[str, Any]:
+def build_repository_manifest(repo_files: Optional[List[Tuple[pathlib.Path, int, str]]] = None) -> Dict[str, Any]:
     """Build repository file manifest and metadata"""
+    if repo_files is None:
+        repo_files = _walk_repo()
+
     all_files = []
-    
-    # Collect files with size limits for security
-    for file_path in ROOT.rglob("*"):
-        if file_path.is_file():
-            try:
-                size = file_path.stat().st_size
-                if size < 1_000_000:  # Skip files > 1MB for security
-                    rel_path = str(file_path.relative_to(ROOT))
-                    all_files.append({
-                        "path": rel_path,
-                        "size": size,
-                        "extension": file_path.suffix
-                    })
-            except (OSError, ValueError):
-                continue
-    
-    # Limit total files for performance
-    if len(all_files) > 1000:
-        all_files = all_files[:1000]
-    
-    # File type analysis
-    extensions = {}
-    for file_info in all_files:
-        ext = file_info["extension"].lower()
-        extensions[ext] = extensions.get(ext, 0) + 1
-    
+    config_files = []
+
+    # Collect files with size limits for security; stop once the
+    # manifest cap is hit instead of building everything and slicing
+    for file_path, size, suffix in repo_files:
+        if size < 1_000_000:  # Skip files > 1MB for security
+            rel = _rel_path(file_path)
+            all_files.append({
+                "path": rel,
+                "size": size,
+                "extension": suffix.lower()  # lowered once, reused below
+            })
+            if file_path.name in _CONFIG_NAMES:
+                config_files.append(rel)
+            if len(all_files) >= _MANIFEST_MAX_FILES:
+                break
+
+
+    # File type analysis: Counter's C fast path beats a get/store loop
+    extensions = Counter(file_info["extension"] for file_info in all_files)
+
     return {
         "total_files": len(all_files),
         "files": all_files,
         "file_types": extensions,
-        "config_files": [
-            f["path"] for f in all_files 
-            if f["path"].split("/")[-1] in [
-                "requirements.txt", "package.json", "pom.xml", "build.gradle",
-                "pytest.ini", "jest.config.js", ".gitignore", "README.md"
-            ]
-        ]
+        "config_files": config_files
     }
 
-def extract_public_surface(stack: str) -> List[Dict[str, Any]]:
+def extract_public_surface(stack: str,
+                           repo_files: Optional[List[Tuple[pathlib.Path, int, str]]] = None) -> List[Dict[str, Any]]:
     """Extract public API surface for the detected stack"""
     extractor = PublicSurfaceExtractor()
     surface = []
-    
+
+    if repo_files is None:
+        repo_files = _walk_repo()
+
+    def _files_with(suffixes: Tuple[str, ...]):
+        return (path for path, _size, suffix in repo_files if suffix in suffixes)
+
     if stack == "python":
-        for py_file in ROOT.rglob("*.py"):
-            if not any(part.startswith('.') for part in py_file.parts):  # Skip hidden dirs
-                file_surface = extractor.extract_python_surface(py_file)
-                for item in file_surface:
-                    item["file"] = str(py_file.relative_to(ROOT))
-                surface.extend(file_surface)
-    
-    elif stack == "node":
-        for js_file in ROOT.rglob("*.js"):
-            file_surface = extractor.extract_javascript_surface(js_file)
+        # _walk_repo prunes hidden/vendored dirs already; the substring
+        # guard keeps caller-supplied file lists honest without paying
+        # for a Path.parts tuple per file
+        py_files = [py_file for py_file in _files_with((".py",))
+                    if not _is_hidden_rel(_rel_path(py_file))]
+
+        if len(py_files) >= _PARALLEL_PARSE_MIN_FILES:
+            # AST parsing is CPU-bound and independent per file; fan out
+            # across cores. Below the threshold, pool startup would dominate.
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                parsed = executor.map(
+                    PublicSurfaceExtractor.extract_python_surface,
+                    py_files, chunksize=4)
+                file_surfaces = list(zip(py_files, parsed))
+        else:
+            file_surfaces = [(py_file, extractor.extract_python_surface(py_file))
+                             for py_file in py_files]
+
+        for py_file, file_surface in file_surfaces:
             for item in file_surface:
-                item["file"] = str(js_file.relative_to(ROOT))
+                item["file"] = _rel_path(py_file)
             surface.extend(file_surface)
-        
-        for ts_file in ROOT.rglob("*.ts"):
-            file_surface = extractor.extract_javascript_surface(ts_file)
+
+    elif stack == "node":
+        for js_file in _files_with((".js", ".ts")):
+            file_surface = extractor.extract_javascript_surface(js_file)
             for item in file_surface:
-                item["file"] = str(ts_file.relative_to(ROOT))
+                item["file"] = _rel_path(js_file)
             surface.extend(file_surface)
-    
+
     elif stack == "java":
-        for java_file in ROOT.rglob("*.java"):
+        for java_file in _files_with((".java",)):
             file_surface = extractor.extract_java_surface(java_file)
             for item in file_surface:
-                item["file"] = str(java_file.relative_to(ROOT))
+                item["file"] = _rel_path(java_file)
             surface.extend(file_surface)
-    
+
     # Limit results for performance and security
     return surface[:500]
 
@@ -552,7 +804,7 @@ def main():
         if args.output != str(ARTIFACTS / "context.json"):
             output_path = pathlib.Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(json.dumps(context, indent=2))
+            _dump_context(context, output_path)
             print(f"Context written to: {output_path}")
         
         print(f"✅ Context building completed successfully")
@@ -13,45 +13,104 @@ Provides structured context about:
 This ensures LLM-generated tests are grounded in repository reality.
 """
 
+import functools
 import json
 import pathlib
+import pickle
 import re
 import ast
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Set, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 
+# Relative paths via prefix slicing: os.path.relpath re-splits and
+# rejoins both paths per call, a plain slice is one C string operation.
+_ROOT_PREFIX = str(ROOT) + os.sep
+
+
+def _rel_path(path_str: str) -> str:
+    """Repository-relative path for an absolute path string."""
+    if path_str.startswith(_ROOT_PREFIX):
+        return path_str[len(_ROOT_PREFIX):]
+    return path_str
+
+# Directories pruned before descent; rglob used to walk .git and
+# node_modules in full only to filter every file afterwards.
+EXCLUDED_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', 'target', 'build',
+    'venv', '.venv', 'env', 'site-packages',
+})
+
+# Binary/build artifacts never worth listing
+_SKIP_SUFFIXES = frozenset({'.pyc', '.pyo', '.so', '.dylib', '.dll', '.exe'})
+
+# Only this many paths are kept in the manifest sample
+SAMPLE_CAP = 100
+
+@functools.lru_cache(maxsize=1)
 def summarize_repo() -> Dict[str, Any]:
-    """Generate a comprehensive repository manifest."""
+    """Generate a comprehensive repository manifest.
+
+    Memoized: build_llm_context and extract_public_surface both call
+    this, and the tree walk only needs to happen once per process.
+    """
     try:
-        files = []
-        for p in ROOT.rglob("*"):
-            if p.is_file():
-                try:
-                    # Skip large binary files and build artifacts
-                    if p.suffix in ['.pyc', '.pyo', '.so', '.dylib', '.dll', '.exe']:
-                        continue
-                    if any(part.startswith('.') for part in p.parts):
-                        continue
-                    if 'node_modules' in p.parts or '__pycache__' in p.parts:
-                        continue
-                    if 'target' in p.parts or 'build' in p.parts:
-                        continue
-                    
-                    files.append(str(p.relative_to(ROOT)))
-                except (ValueError, OSError):
-                    continue
-        
-        # Language detection
-        has_py = any(p.endswith(".py") for p in files)
-        has_js = any(p.endswith((".js", ".ts", ".jsx", ".tsx")) for p in files)
-        has_java = any(p.endswith(".java") for p in files)
-        
+        files_sample = []
+        total_files = 0
+        suffixes_seen = set()
+        js_suffixes = {".js", ".ts", ".jsx", ".tsx"}
+
+        def _saturated():
+            # Nothing left to learn: sample is full and every language
+            # flag the manifest reports has already been decided
+            return (len(files_sample) >= SAMPLE_CAP
+                    and ".py" in suffixes_seen
+                    and ".java" in suffixes_seen
+                    and not js_suffixes.isdisjoint(suffixes_seen))
+
+        # Explicit scandir recursion: DirEntry caches the file type from
+        # readdir, and excluded directories are pruned before descent
+        # instead of filtered file-by-file afterwards. Returns True when
+        # the walk can stop early (sample and language flags saturated).
+        def walk(dirpath):
+            nonlocal total_files
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in EXCLUDED_DIRS and not name.startswith('.'):
+                            if walk(entry.path):
+                                return True
+                    elif entry.is_file(follow_symlinks=False):
+                        suffix = os.path.splitext(name)[1]
+                        if suffix in _SKIP_SUFFIXES or name.startswith('.'):
+                            continue
+                        total_files += 1
+                        suffixes_seen.add(suffix)
+                        if len(files_sample) < SAMPLE_CAP:
+                            files_sample.append(_rel_path(entry.path))
+                        elif _saturated():
+                            return True
+            return False
+
+        walk(ROOT)
+
+        # Language detection from the suffixes gathered during the walk
+        has_py = ".py" in suffixes_seen
+        has_js = not js_suffixes.isdisjoint(suffixes_seen)
+        has_java = ".java" in suffixes_seen
+
         manifest = {
-            "total_files": len(files),
-            "files_sample": files[:100],  # Cap to prevent huge contexts
+            "total_files": total_files,
+            "files_sample": files_sample,  # Cap to prevent huge contexts
             "config_files": {
                 "requirements_txt": (ROOT / "requirements.txt").exists(),
                 "package_json": (ROOT / "package.json").exists(),
@@ -82,55 +141,148 @@ def summarize_repo() -> Dict[str, Any]:
             "test_directories": []
         }
 
+_SURFACE_CACHE_PATH = ROOT / "genai_artifacts" / "ast_cache.pkl"
+
+# Bump whenever the shape or semantics of cached entries change, so
+# stale caches from older extraction logic are discarded wholesale.
+_SURFACE_CACHE_VERSION = 2
+
+
+def _load_surface_cache() -> Dict[str, Tuple[int, int, List[Dict[str, Any]]]]:
+    """Load the per-file surface cache: rel_path -> (mtime_ns, size, entries)."""
+    try:
+        with _SURFACE_CACHE_PATH.open('rb') as f:
+            version, cache = pickle.load(f)
+        return cache if version == _SURFACE_CACHE_VERSION else {}
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            TypeError, ValueError):
+        return {}
+
+
+def _save_surface_cache(cache: Dict[str, Tuple[int, int, List[Dict[str, Any]]]]) -> None:
+    """Persist the surface cache atomically (write temp, then rename)."""
+    try:
+        _SURFACE_CACHE_PATH.parent.mkdir(exist_ok=True)
+        tmp_path = _SURFACE_CACHE_PATH.with_suffix('.pkl.tmp')
+        with tmp_path.open('wb') as f:
+            pickle.dump((_SURFACE_CACHE_VERSION, cache), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _SURFACE_CACHE_PATH)
+    except OSError:
+        pass  # Cache is an optimization; never fail the build over it
+
+
+# Below this many uncached files the pool startup cost dominates the
+# parse work; fall back to in-process extraction.
+_PARALLEL_MIN_FILES = 8
+
+# Hoisted once: path components that disqualify a file (hash probes via
+# isdisjoint) and name prefixes checked per component.
+_EXCLUDED_PARTS = frozenset({
+    'tests', 'venv', '.venv', 'env', '.env', 'node_modules',
+    'site-packages', '__pycache__',
+})
+_EXCLUDED_PREFIXES = ('test_', '.')
+
+
+def _extract_one(py_path: str) -> List[Dict[str, Any]]:
+    """Parse one file and return its public surface entries.
+
+    Module-level (picklable) so ProcessPoolExecutor workers can run it.
+    """
+    rel_path = _rel_path(py_path)
+    entries = []
+    try:
+        with open(py_path, encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        tree = ast.parse(content, filename=py_path)
+    except (SyntaxError, UnicodeDecodeError, OSError):
+        return entries
+
+    # Public API lives in the module body; scanning tree.body instead of
+    # ast.walk skips every expression node and all nested/helper defs
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # Only public functions (not starting with _)
+            if not node.name.startswith('_'):
+                entries.append({
+                    "file": rel_path,
+                    "name": node.name,
+                    "type": "function",
+                    "line": node.lineno
+                })
+
+        elif isinstance(node, ast.ClassDef):
+            # Only public classes
+            if not node.name.startswith('_'):
+                entries.append({
+                    "file": rel_path,
+                    "name": node.name,
+                    "type": "class",
+                    "line": node.lineno
+                })
+
+    return entries
+
+
 def extract_python_surface() -> List[Dict[str, Any]]:
     """Extract public functions and classes from Python files."""
     surface = []
-    
+
     try:
+        # Warm runs skip read+parse for files whose (mtime_ns, size)
+        # still matches the cached entry from the previous CI pass
+        cache = _load_surface_cache()
+
+        candidates: List[Tuple[str, os.stat_result]] = []
         files_processed = 0
         for py_file in ROOT.rglob("*.py"):
             # Skip test files, __pycache__, virtual environments, and hidden dirs
-            if any(part.startswith(('test_', '__pycache__', '.')) for part in py_file.parts):
+            parts = py_file.parts
+            if not _EXCLUDED_PARTS.isdisjoint(parts):
                 continue
-            if any(part in ('tests', 'venv', '.venv', 'env', '.env', 'node_modules', 'site-packages') for part in py_file.parts):
+            if any(part.startswith(_EXCLUDED_PREFIXES) for part in parts):
                 continue
-            
+
             files_processed += 1
             # Limit processing to avoid infinite loops with large repositories
             if files_processed > 100:
                 print(f":: Limiting to 100 files for performance")
                 break
-                
+
             try:
-                content = py_file.read_text(encoding='utf-8', errors='ignore')
-                tree = ast.parse(content, filename=str(py_file))
-                
-                rel_path = str(py_file.relative_to(ROOT))
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        # Only public functions (not starting with _)
-                        if not node.name.startswith('_'):
-                            surface.append({
-                                "file": rel_path,
-                                "name": node.name,
-                                "type": "function",
-                                "line": node.lineno
-                            })
-                    
-                    elif isinstance(node, ast.ClassDef):
-                        # Only public classes
-                        if not node.name.startswith('_'):
-                            surface.append({
-                                "file": rel_path,
-                                "name": node.name,
-                                "type": "class",
-                                "line": node.lineno
-                            })
-                            
-            except (SyntaxError, UnicodeDecodeError, OSError):
+                stat = py_file.stat()
+            except OSError:
                 continue
-                
+            candidates.append((str(py_file), stat))
+
+        # Split cache hits from files that need a fresh parse
+        to_parse = [
+            py_path for py_path, stat in candidates
+            if (cached := cache.get(_rel_path(py_path))) is None
+            or cached[0] != stat.st_mtime_ns or cached[1] != stat.st_size
+        ]
+
+        # Parsing is CPU-bound and per-file independent; fan out across
+        # cores when enough files miss the cache
+        if len(to_parse) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                parsed = dict(zip(to_parse, ex.map(_extract_one, to_parse, chunksize=4)))
+        else:
+            parsed = {py_path: _extract_one(py_path) for py_path in to_parse}
+
+        # Assemble in walk order, updating the cache for fresh parses
+        for py_path, stat in candidates:
+            rel_path = _rel_path(py_path)
+            if py_path in parsed:
+                entries = parsed[py_path]
+                cache[rel_path] = (stat.st_mtime_ns, stat.st_size, entries)
+            else:
+                entries = cache[rel_path][2]
+            surface.extend(entries)
+
+        if parsed:
+            _save_surface_cache(cache)
+
     except Exception as e:
         print(f"Warning: Failed to extract Python surface: {e}")
     
@@ -198,10 +350,16 @@ def build_llm_context() -> Dict[str, Any]:
         }
     }
     
-    # Save context to artifacts
+    # Save context to artifacts. orjson serializes straight to bytes
+    # several times faster than stdlib json; without it, json.dump
+    # streams into the file in chunks with compact separators.
     output_path = ROOT / "genai_artifacts" / "context.json"
     output_path.parent.mkdir(exist_ok=True)
-    output_path.write_text(json.dumps(context, indent=2))
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(context))
+    else:
+        with output_path.open('w', encoding='utf-8') as f:
+            json.dump(context, f, separators=(',', ':'))
     
     print(f":: Context saved to {output_path}")
     print(f":: Found {len(context['public_surface']['python'])} Python symbols")
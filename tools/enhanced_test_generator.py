@@ -8,16 +8,53 @@ This module generates pytest test cases using LLM while ensuring:
 3. Context-aware test generation based on actual code structure
 """
 
+import io
 import os
 import json
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import ast
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Dict, List, Optional, Tuple
 
+# Code-block extraction patterns compiled once at import; only the
+# first block is ever used, so callers search instead of findall.
+_PY_BLOCK_RE = re.compile(r'```python\s*\n(.*?)\n```', re.DOTALL)
+_ANY_BLOCK_RE = re.compile(r'```\s*\n(.*?)\n```', re.DOTALL)
+
+# Test-file header; the model name is frozen in at construction so each
+# save only fills the module path and timestamp.
+_HEADER_TMPL = '''#!/usr/bin/env python3
+"""
+Generated test file for {module_path}
+Created by: Enhanced LLM Test Generator
+Generated at: {timestamp}
+Model: {model}
+
+This file contains automatically generated pytest test cases.
+"""
+
+import sys
+import os
+# Add project root to Python path for local imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+'''
+
+# Assembled prompt templates keyed by (root, template mtime_ns). The
+# template is a constant for a given root until the file changes, so
+# repeated generator constructions skip the read and the package scan.
+_TEMPLATE_CACHE: Dict[Tuple[str, int], str] = {}
+
 class EnhancedTestGenerator:
     def __init__(self, project_root: str = None):
         self.root = Path(project_root or Path(__file__).resolve().parents[1])
@@ -29,22 +66,60 @@ class EnhancedTestGenerator:
         self.model = os.getenv("OLLAMA_MODEL", "qwen2.5-coder:1.5b")
         self.ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
         self.max_retries = 3
+        # Total wall-clock budget per generation attempt; enforced
+        # around the streaming loop so a generation that keeps
+        # trickling tokens still terminates
         self.timeout = 120
-        
+        # Per-chunk read timeout while streaming; a stall is detected in
+        # seconds rather than after the full timeout budget
+        self.stream_read_timeout = 30
+
+        # Pooled session: keep-alive reuses the Ollama socket across
+        # every module and retry instead of a TCP handshake per call
+        self.session = requests.Session()
+        self.session.mount(self.ollama_host,
+                           HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+        # Header with the model baked in; saves only format the
+        # per-file fields
+        self._header_tmpl = _HEADER_TMPL.replace("{model}", self.model)
+
+        # Parsed bundle cache: (mtime_ns, dict), refreshed only when the
+        # file on disk changes
+        self._bundle_cache: Optional[Tuple[int, Dict]] = None
+
         # Load improved prompt template
         self.prompt_template = self._load_prompt_template()
+
+        # Constant skeleton up to the first variable field, built once;
+        # per-module assembly only appends the variable sections
+        self._prompt_prefix = (
+            f"{self.prompt_template}\n\n=== TARGET MODULE FOR TESTING ===\n"
+        )
         
     def _load_prompt_template(self) -> str:
         """Load and enhance the prompt template with project-specific guidance"""
         template_path = self.root / "llm_agent" / "prompt_template.txt"
-        if template_path.exists():
+        try:
+            template_mtime = template_path.stat().st_mtime_ns
+        except OSError:
+            template_mtime = 0
+
+        cache_key = (str(self.root), template_mtime)
+        cached = _TEMPLATE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if template_mtime:
             base_template = template_path.read_text(encoding="utf-8")
         else:
             base_template = self._get_default_template()
-        
+
         # Add project-specific import guidance
         project_guidance = self._generate_import_guidance()
-        return f"{base_template}\n\n{project_guidance}"
+        template = f"{base_template}\n\n{project_guidance}"
+        _TEMPLATE_CACHE[cache_key] = template
+        return template
     
     def _generate_import_guidance(self) -> str:
         """Generate project-specific import guidance based on actual structure"""
@@ -114,69 +189,83 @@ OUTPUT: Single Python file wrapped in ```python ``` code block only.
         """Load the context bundle with error handling"""
         if not self.bundle_path.exists():
             raise FileNotFoundError(f"Context bundle not found: {self.bundle_path}")
-        
+
+        # generate_all_tests loads the bundle once per module; the mtime
+        # check skips the repeated JSON decode of identical content
+        mtime = self.bundle_path.stat().st_mtime_ns
+        if self._bundle_cache is not None and self._bundle_cache[0] == mtime:
+            return self._bundle_cache[1]
+
         try:
-            with open(self.bundle_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            raw = self.bundle_path.read_bytes()
+            bundle = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (json.JSONDecodeError, ValueError) as e:
             raise ValueError(f"Invalid JSON in context bundle: {e}")
+
+        # Index once per parse so prompt building does dict lookups
+        # instead of scanning the files list per module
+        files = bundle.get("files", [])
+        bundle["_by_path"] = {f["path"]: f for f in files}
+        bundle["_context_pool"] = [f for f in files if f.get("full_text")]
+        bundle["_python_paths"] = tuple(
+            f["path"] for f in files if f.get("language") == "python")
+
+        self._bundle_cache = (mtime, bundle)
+        return bundle
     
     def build_enhanced_prompt(self, bundle: Dict, module_path: str) -> Optional[str]:
         """Build an enhanced prompt with better context and validation"""
-        files = bundle.get("files", [])
-        target_file = next((f for f in files if f["path"] == module_path), None)
-        
+        target_file = bundle.get("_by_path", {}).get(module_path)
+
         if not target_file:
             print(f"Module {module_path} not found in bundle")
             return None
         
-        # Build comprehensive context
-        prompt_parts = [
-            self.prompt_template,
-            "\n=== TARGET MODULE FOR TESTING ===",
-            f"File: {target_file['path']}",
-            f"Language: {target_file.get('language', 'python')}",
-        ]
-        
+        # Build comprehensive context into one growing buffer; StringIO
+        # avoids holding every section plus the joined copy at once
+        buf = io.StringIO()
+
+        def _write_capped(text: str, cap: int) -> None:
+            # Slicing copies; skip it when the text already fits
+            buf.write(text if len(text) <= cap else text[:cap])
+
+        buf.write(self._prompt_prefix)
+        buf.write(f"File: {target_file['path']}\n"
+                  f"Language: {target_file.get('language', 'python')}")
+
         # Add diff if available
         if target_file.get("unified_diff"):
-            prompt_parts.extend([
-                "\nCHANGES (unified diff):",
-                "```diff",
-                target_file["unified_diff"][:5000],  # Limit diff size
-                "```"
-            ])
-        
+            buf.write("\n\nCHANGES (unified diff):\n```diff\n")
+            _write_capped(target_file["unified_diff"], 5000)  # Limit diff size
+            buf.write("\n```")
+
         # Add full file content
         if target_file.get("full_text"):
-            prompt_parts.extend([
-                "\nFULL FILE CONTENT:",
-                "```python",
-                target_file["full_text"][:15000],  # Limit content size
-                "```"
-            ])
-        
-        # Add context from related files
-        related_files = [f for f in files if f["path"] != module_path and f.get("full_text")]
+            buf.write("\n\nFULL FILE CONTENT:\n```python\n")
+            _write_capped(target_file["full_text"], 15000)  # Limit content size
+            buf.write("\n```")
+
+        # Add context from related files (pre-filtered to those with text)
+        related_files = [f for f in bundle.get("_context_pool", [])
+                         if f["path"] != module_path]
         if related_files:
-            prompt_parts.append("\n=== CONTEXT FILES (for imports/dependencies) ===")
+            buf.write("\n\n=== CONTEXT FILES (for imports/dependencies) ===")
             for rf in related_files[:3]:  # Limit to first 3 related files
-                prompt_parts.extend([
-                    f"\n## {rf['path']}",
-                    "```python",
-                    rf["full_text"][:8000],  # Smaller limit for context files
-                    "```"
-                ])
-        
+                buf.write(f"\n\n## {rf['path']}\n```python\n")
+                _write_capped(rf["full_text"], 8000)  # Smaller limit for context files
+                buf.write("\n```")
+
         # Add analysis results if available
         targets = bundle.get("targets", {})
         if module_path in targets:
-            prompt_parts.extend([
-                "\n=== CODE ANALYSIS ===",
-                json.dumps(targets[module_path], indent=2)
-            ])
-        
-        return "\n".join(prompt_parts)
+            buf.write("\n\n=== CODE ANALYSIS ===\n")
+            if orjson is not None:
+                buf.write(orjson.dumps(targets[module_path],
+                                       option=orjson.OPT_INDENT_2).decode('utf-8'))
+            else:
+                buf.write(json.dumps(targets[module_path], indent=2))
+
+        return buf.getvalue()
     
     def call_ollama_with_retry(self, prompt: str) -> Optional[str]:
         """Call Ollama with retry logic and better error handling"""
@@ -184,27 +273,60 @@ OUTPUT: Single Python file wrapped in ```python ``` code block only.
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "options": {
                 "temperature": 0.1,  # Lower temperature for more consistent code
                 "top_p": 0.9,
                 "num_predict": 4096,
             }
         }
-        
+        loads = orjson.loads if orjson is not None else json.loads
+
         for attempt in range(self.max_retries):
             try:
                 print(f"🤖 Calling Ollama (attempt {attempt + 1}/{self.max_retries})...")
-                response = requests.post(url, json=payload, timeout=self.timeout)
-                response.raise_for_status()
-                
-                result = response.json()
-                if "response" in result:
-                    return result["response"]
+                deadline = time.monotonic() + self.timeout
+                if orjson is not None:
+                    # orjson encodes large prompts much faster than the
+                    # stdlib encoder behind requests' json= kwarg
+                    response = self.session.post(
+                        url, data=orjson.dumps(payload),
+                        headers={'Content-Type': 'application/json'},
+                        stream=True, timeout=(5, self.stream_read_timeout))
                 else:
-                    print(f"Unexpected response format: {result}")
-                    continue
-                    
+                    response = self.session.post(
+                        url, json=payload,
+                        stream=True, timeout=(5, self.stream_read_timeout))
+                response.raise_for_status()
+
+                # Accumulate NDJSON tokens as they arrive. A stalled
+                # generation trips the per-chunk read timeout instead of
+                # burning the full end-to-end budget, and nothing ever
+                # holds the whole response as a single JSON blob.
+                chunks = []
+                done = False
+                for line in response.iter_lines():
+                    if time.monotonic() > deadline:
+                        # Tokens kept arriving but the attempt blew its
+                        # total budget; treat it like any other timeout
+                        response.close()
+                        raise requests.exceptions.Timeout(
+                            f"Generation exceeded {self.timeout}s total budget")
+                    if not line:
+                        continue
+                    obj = loads(line)
+                    token = obj.get("response")
+                    if token:
+                        chunks.append(token)
+                    if obj.get("done"):
+                        done = True
+                        break
+
+                if done or chunks:
+                    return "".join(chunks)
+                print(f"Empty response from Ollama")
+                continue
+
             except requests.exceptions.Timeout:
                 print(f"Timeout on attempt {attempt + 1}")
                 if attempt < self.max_retries - 1:
@@ -224,18 +346,28 @@ OUTPUT: Single Python file wrapped in ```python ``` code block only.
         print(f"❌ Failed to get response after {self.max_retries} attempts")
         return None
     
-    def extract_and_validate_code(self, llm_response: str) -> Optional[str]:
-        """Extract Python code from LLM response and validate it"""
+    # Responses beyond this size are junk generations; refuse to parse
+    # them rather than let a pathological input stall the CI step
+    MAX_VALIDATE_BYTES = 200_000
+
+    def extract_and_validate_code(self, llm_response: str) -> Optional[Tuple[str, ast.Module]]:
+        """Extract Python code from LLM response and validate it.
+
+        Returns (code, tree) so downstream quality checks can reuse the
+        parsed AST instead of paying for a second parse; callers that
+        only need validation can ignore the tree.
+        """
         if not llm_response:
             return None
         
-        # Extract code from markdown code blocks
-        code_blocks = re.findall(r'```python\s*\n(.*?)\n```', llm_response, re.DOTALL)
-        if not code_blocks:
+        # Extract the first markdown code block; search stops at the
+        # first match instead of materializing every block
+        match = _PY_BLOCK_RE.search(llm_response)
+        if not match:
             # Try without language specifier
-            code_blocks = re.findall(r'```\s*\n(.*?)\n```', llm_response, re.DOTALL)
-        
-        if not code_blocks:
+            match = _ANY_BLOCK_RE.search(llm_response)
+
+        if not match:
             # If no code blocks, try to use the whole response if it looks like Python
             if ('import ' in llm_response and 'def test_' in llm_response):
                 code = llm_response.strip()
@@ -243,13 +375,17 @@ OUTPUT: Single Python file wrapped in ```python ``` code block only.
                 print("❌ No valid Python code blocks found in LLM response")
                 return None
         else:
-            code = code_blocks[0].strip()
+            code = match.group(1).strip()
         
+        if len(code) > self.MAX_VALIDATE_BYTES:
+            print(f"❌ Generated code too large to validate ({len(code)} chars)")
+            return None
+
         # Basic syntax validation
         try:
-            ast.parse(code)
+            tree = ast.parse(code)
             print("✅ Generated code passed syntax validation")
-            return code
+            return code, tree
         except SyntaxError as e:
             print(f"❌ Generated code has syntax errors: {e}")
             return None
@@ -262,26 +398,15 @@ OUTPUT: Single Python file wrapped in ```python ``` code block only.
         test_path = self.out_dir / test_filename
         
         # Add file header with metadata
-        header = f'''#!/usr/bin/env python3
-"""
-Generated test file for {module_path}
-Created by: Enhanced LLM Test Generator
-Generated at: {time.strftime("%Y-%m-%d %H:%M:%S")}
-Model: {self.model}
-
-This file contains automatically generated pytest test cases.
-"""
-
-import sys
-import os
-# Add project root to Python path for local imports  
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-'''
+        header = self._header_tmpl.format(
+            module_path=module_path,
+            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"))
         
-        # Write the file
-        with open(test_path, 'w', encoding='utf-8') as f:
-            f.write(header + code)
+        # Write header and code as two binary chunks; no concatenated
+        # intermediate string and no encode-on-flush through the text layer
+        with open(test_path, 'wb', buffering=0) as f:
+            f.write(header.encode('utf-8'))
+            f.write(code.encode('utf-8'))
         
         print(f"💾 Saved test file: {test_path}")
         return test_path
@@ -304,11 +429,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
             if not llm_response:
                 return None
             
-            # Extract and validate code
-            test_code = self.extract_and_validate_code(llm_response)
-            if not test_code:
+            # Extract and validate code (the parsed tree is unused here)
+            validated = self.extract_and_validate_code(llm_response)
+            if not validated:
                 return None
-            
+            test_code, _tree = validated
+
             # Save test file
             test_path = self.save_test_file(test_code, module_path)
             return test_path
@@ -321,16 +447,25 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         """Generate tests for all modules in the context bundle"""
         try:
             bundle = self.load_context_bundle()
-            files = bundle.get("files", [])
-            python_files = [f["path"] for f in files if f.get("language") == "python"]
-            
+            python_files = bundle.get("_python_paths", ())
+
             print(f"📁 Found {len(python_files)} Python files to test")
-            
+
+            # Each module spends its time waiting on the Ollama HTTP
+            # response, so threads turn sum-of-latencies into roughly
+            # max-of-latencies per batch; the pooled session gives each
+            # worker a kept-alive connection
+            max_workers = int(os.getenv("GENAI_CONCURRENCY", "4"))
             generated_files = []
-            for module_path in python_files:
-                test_file = self.generate_tests_for_module(module_path)
-                if test_file:
-                    generated_files.append(test_file)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.generate_tests_for_module, module_path): module_path
+                    for module_path in python_files
+                }
+                for future in as_completed(futures):
+                    test_file = future.result()
+                    if test_file:
+                        generated_files.append(test_file)
             
             print(f"\n✅ Generated {len(generated_files)} test files:")
             for file_path in generated_files:
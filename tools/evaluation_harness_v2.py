@@ -13,30 +13,65 @@ Pre-merge validation pipeline that ensures test quality through:
 Only tests that pass all gates are allowed to merge.
 """
 
+import ast
+import functools
+import hashlib
+import importlib.util
 import json
+import marshal
+import os
 import pathlib
+import pickle
+import collections
+import compileall
 import subprocess
 import sys
+import threading
 import tempfile
+import time
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 ARTIFACTS = ROOT / "genai_artifacts"
 
-@dataclass
+
+def _dump_report_bytes(report: "EvaluationReport") -> bytes:
+    """Serialize an evaluation report to indented JSON bytes.
+
+    orjson serializes dataclasses natively in C — no asdict deep copy,
+    no Python-level formatting walk. The stdlib fallback keeps the old
+    asdict + json.dumps path.
+    """
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(asdict(report), indent=2, default=str).encode('utf-8')
+
+# Fewer work items than this run inline; pool startup would dominate.
+_PARALLEL_MIN_ITEMS = 4
+
+# slots=True drops the per-instance __dict__: roughly half the memory
+# per result, faster attribute access in the aggregation loop, and a
+# smaller pickle payload across the process-pool workers.
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a single validation check."""
     check_name: str
     passed: bool
     score: float  # 0.0 to 1.0
     message: str
-    details: Dict[str, Any] = None
+    details: Optional[Dict[str, Any]] = field(default_factory=dict)
     execution_time: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationReport:
     """Comprehensive evaluation report."""
     timestamp: str
@@ -50,12 +85,819 @@ class EvaluationReport:
     summary: Dict[str, Any]
     recommendations: List[str]
 
+# --- Parse cache -----------------------------------------------------------
+#
+# Syntax and import checks both re-read and re-parse every file on every
+# run, even when nothing changed between CI passes. Cache the compiled
+# code object (marshal) and the extracted import names on disk, keyed by
+# SHA-256 of the file content, sharded entries/{hash[:2]}/{hash[2:]}.pkl.
+# Entries record the interpreter version since marshal is not stable
+# across Python releases.
+
+_PARSE_CACHE_DIR = ARTIFACTS / "parse_cache" / "entries"
+
+# Bump when the extraction semantics change so stale entries reparse.
+_PARSE_CACHE_VERSION = 2
+
+
+def _load_or_parse(test_file: pathlib.Path) -> List[str]:
+    """Parse a Python file (or load its cached parse) and return import names.
+
+    Raises SyntaxError on invalid source, exactly like ast.parse. A cache
+    hit proves the content compiled cleanly under this interpreter, so
+    syntax checking degenerates to a hash lookup on warm runs.
+    """
+    content_bytes = test_file.read_bytes()
+    digest = hashlib.sha256(content_bytes).hexdigest()
+    entry_path = _PARSE_CACHE_DIR / digest[:2] / (digest[2:] + ".pkl")
+
+    try:
+        with entry_path.open('rb') as f:
+            version, code_bytes, import_names, py_version = pickle.load(f)
+        if version == _PARSE_CACHE_VERSION and py_version == sys.version_info[:2]:
+            marshal.loads(code_bytes)  # sanity: entry round-trips
+            return import_names
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    tree = ast.parse(content_bytes, filename=str(test_file))
+    # Imports live at module top level (or directly under a top-level
+    # guard like `if TYPE_CHECKING:`); scanning tree.body instead of
+    # ast.walk skips every expression node in the file
+    import_names = []
+    def _collect(stmts):
+        for node in stmts:
+            if isinstance(node, ast.Import):
+                import_names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                import_names.append(node.module)
+            elif isinstance(node, (ast.If, ast.Try)):
+                _collect(node.body)
+                for handler in getattr(node, 'handlers', ()):
+                    _collect(handler.body)
+                _collect(node.orelse)
+    _collect(tree.body)
+
+    try:
+        code = compile(tree, str(test_file), 'exec')
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_suffix('.pkl.tmp')
+        with tmp_path.open('wb') as f:
+            pickle.dump((_PARSE_CACHE_VERSION, marshal.dumps(code),
+                         import_names, sys.version_info[:2]),
+                        f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+    except (OSError, ValueError):
+        pass  # Cache is an optimization; never fail a check over it
+
+    return import_names
+
+
+# --- Per-file check functions ---------------------------------------------
+#
+# Module-level (picklable) so evaluate_tests can dispatch them through a
+# ProcessPoolExecutor; each takes (file path string, stack, config dict)
+# and returns a ValidationResult. The harness methods delegate here.
+
+def _syntax_check(test_file_str: str, stack: str, config: Dict[str, Any]) -> ValidationResult:
+    """Check syntax validity using language-specific tools."""
+    test_file = pathlib.Path(test_file_str)
+    t0 = time.perf_counter()
+
+    try:
+        if stack == "python" and test_file.suffix == ".py":
+            # Parse (or hit the content-hash cache from a previous run)
+            _load_or_parse(test_file)
+
+            return ValidationResult(
+                check_name="syntax_validation",
+                passed=True,
+                score=1.0,
+                message="Python syntax is valid",
+                execution_time=time.perf_counter() - t0
+            )
+
+        elif stack == "node" and test_file.suffix in [".js", ".ts"]:
+            # Use node --check for JavaScript
+            result = subprocess.run(
+                ["node", "--check", str(test_file)],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+
+            if result.returncode == 0:
+                return ValidationResult(
+                    check_name="syntax_validation",
+                    passed=True,
+                    score=1.0,
+                    message="JavaScript syntax is valid",
+                    execution_time=time.perf_counter() - t0
+                )
+            else:
+                return ValidationResult(
+                    check_name="syntax_validation",
+                    passed=False,
+                    score=0.0,
+                    message=f"Syntax error: {result.stderr}",
+                    execution_time=time.perf_counter() - t0
+                )
+
+        elif stack == "java" and test_file.suffix == ".java":
+            # Use javac for Java (compilation check)
+            with tempfile.TemporaryDirectory() as temp_dir:
+                result = subprocess.run(
+                    ["javac", "-cp", ".", "-d", temp_dir, str(test_file)],
+                    capture_output=True,
+                    text=True,
+                    timeout=15
+                )
+
+                if result.returncode == 0:
+                    return ValidationResult(
+                        check_name="syntax_validation",
+                        passed=True,
+                        score=1.0,
+                        message="Java compilation successful",
+                        execution_time=time.perf_counter() - t0
+                    )
+                else:
+                    return ValidationResult(
+                        check_name="syntax_validation",
+                        passed=False,
+                        score=0.0,
+                        message=f"Compilation error: {result.stderr}",
+                        execution_time=time.perf_counter() - t0
+                    )
+
+        else:
+            # Unknown or unsupported file type
+            return ValidationResult(
+                check_name="syntax_validation",
+                passed=True,
+                score=0.5,
+                message=f"Syntax check not available for {stack}/{test_file.suffix}",
+                execution_time=time.perf_counter() - t0
+            )
+
+    except Exception as e:
+        return ValidationResult(
+            check_name="syntax_validation",
+            passed=False,
+            score=0.0,
+            message=f"Syntax check failed: {str(e)}",
+            execution_time=time.perf_counter() - t0
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_policy_checker():
+    """Build the policy checker once per process.
+
+    The constructor compiles every policy regex, so re-instantiating per
+    file repays that work N times; one instance serves all checks in a
+    worker.
+    """
+    if str(ROOT) not in sys.path:
+        sys.path.append(str(ROOT))
+    from tools.policy_checker_v2 import TestPolicyChecker
+    return TestPolicyChecker()
+
+
+def _policy_check(test_file_str: str, stack: str, config: Dict[str, Any]) -> ValidationResult:
+    """Check policy compliance using policy checker."""
+    test_file = pathlib.Path(test_file_str)
+    t0 = time.perf_counter()
+
+    try:
+        violations = _get_policy_checker().check_file(test_file)
+
+        # Calculate score based on violations
+        error_count = sum(1 for v in violations if v.severity == "error")
+        warning_count = sum(1 for v in violations if v.severity == "warning")
+
+        # Score: 1.0 for no issues, deduct for errors/warnings
+        score = max(0.0, 1.0 - (error_count * 0.2) - (warning_count * 0.1))
+        passed = error_count == 0
+
+        message = f"Policy check: {error_count} errors, {warning_count} warnings"
+        if violations:
+            message += f" (first: {violations[0].message})"
+
+        return ValidationResult(
+            check_name="policy_compliance",
+            passed=passed,
+            score=score,
+            message=message,
+            details={"violations": len(violations), "errors": error_count, "warnings": warning_count},
+            execution_time=time.perf_counter() - t0
+        )
+
+    except Exception as e:
+        return ValidationResult(
+            check_name="policy_compliance",
+            passed=False,
+            score=0.0,
+            message=f"Policy check failed: {str(e)}",
+            execution_time=time.perf_counter() - t0
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _module_available(name: str) -> bool:
+    """Whether a module can be resolved, without executing it.
+
+    find_spec only consults the finders where __import__ would run the
+    module's top-level code (seconds for heavy libraries). The full
+    dotted name is probed — resolving a submodule imports its parent
+    packages, but a top-level-only check would wave through
+    'from pkg.does_not_exist import x', the dominant failure mode in
+    generated tests. Memoized so files importing the same modules share
+    one lookup per worker process.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ValueError, ModuleNotFoundError, ImportError):
+        # Also raised while importing a parent package that is missing
+        # or broken; either way the name doesn't resolve
+        return False
+
+
+def _import_check(test_file_str: str, stack: str, config: Dict[str, Any]) -> ValidationResult:
+    """Check if all imports are valid and available."""
+    test_file = pathlib.Path(test_file_str)
+    t0 = time.perf_counter()
+
+    try:
+        if stack == "python" and test_file.suffix == ".py":
+            # Import names come from the shared parse cache, so warm runs
+            # skip the read + ast.parse + walk entirely
+            import_names = _load_or_parse(test_file)
+
+            missing_imports = [name for name in import_names
+                               if not _module_available(name)]
+
+            if missing_imports:
+                return ValidationResult(
+                    check_name="import_validation",
+                    passed=False,
+                    score=0.5,  # Partial score - syntax is OK but imports missing
+                    message=f"Missing imports: {', '.join(missing_imports[:3])}",
+                    details={"missing_imports": missing_imports},
+                    execution_time=time.perf_counter() - t0
+                )
+            else:
+                return ValidationResult(
+                    check_name="import_validation",
+                    passed=True,
+                    score=1.0,
+                    message="All imports are valid",
+                    execution_time=time.perf_counter() - t0
+                )
+
+        else:
+            # For non-Python files, assume imports are OK if syntax passes
+            return ValidationResult(
+                check_name="import_validation",
+                passed=True,
+                score=0.8,  # Partial score since we can't fully validate
+                message=f"Import validation not available for {stack}",
+                execution_time=time.perf_counter() - t0
+            )
+
+    except Exception as e:
+        return ValidationResult(
+            check_name="import_validation",
+            passed=False,
+            score=0.0,
+            message=f"Import check failed: {str(e)}",
+            execution_time=time.perf_counter() - t0
+        )
+
+
+# Lines of subprocess output kept per stream; enough for the pytest
+# summary and the last few tracebacks (~10KB) without buffering the lot.
+_TAIL_LINES = 50
+
+
+def _run_tail(cmd: List[str], timeout: float, cwd: pathlib.Path) -> Tuple[int, str, str]:
+    """Run a subprocess keeping only the tail of stdout/stderr.
+
+    capture_output buffers the entire stream in memory before the caller
+    slices off the last few hundred characters; verbose test runs can
+    emit megabytes. Reader threads drain each pipe line-by-line into a
+    bounded deque, so memory stays O(tail window) regardless of how much
+    the child prints. Raises subprocess.TimeoutExpired like subprocess.run.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, cwd=cwd)
+    tails = [collections.deque(maxlen=_TAIL_LINES) for _ in range(2)]
+
+    def _drain(stream, tail):
+        for line in stream:
+            tail.append(line)
+        stream.close()
+
+    readers = [threading.Thread(target=_drain, args=(stream, tail), daemon=True)
+               for stream, tail in zip((proc.stdout, proc.stderr), tails)]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    for reader in readers:
+        reader.join()
+    return returncode, "".join(tails[0]), "".join(tails[1])
+
+
+def _execution_check(test_file_str: str, stack: str, config: Dict[str, Any]) -> ValidationResult:
+    """Test execution in sandboxed environment."""
+    test_file = pathlib.Path(test_file_str)
+    t0 = time.perf_counter()
+
+    try:
+        if stack == "python" and test_file.suffix == ".py":
+            # Cheap pre-gate: a file with no test definitions at all can
+            # only ever reach the "no tests found" outcome, so confirm
+            # with a collection-only pass (no fixture setup, no test
+            # runtime) and skip the full pytest run entirely.
+            content_bytes = test_file.read_bytes()
+            if (content_bytes.count(b"def test_") == 0
+                    and content_bytes.count(b"class Test") == 0):
+                collect = subprocess.run(
+                    ["python", "-m", "pytest", str(test_file),
+                     "--collect-only", "-q"],
+                    capture_output=True,
+                    text=True,
+                    timeout=config["sandbox_timeout"],
+                    cwd=ROOT
+                )
+                if "no tests ran" in collect.stdout or "0 tests collected" in collect.stdout \
+                        or "collected 0 items" in collect.stdout:
+                    return ValidationResult(
+                        check_name="execution_test",
+                        passed=False,
+                        score=0.5,
+                        message="Execution completed but no tests found",
+                        details={"stdout": collect.stdout[-200:]},
+                        execution_time=time.perf_counter() - t0
+                    )
+
+            # Run pytest on the file, keeping only the output tail
+            returncode, stdout_tail, stderr_tail = _run_tail(
+                ["python", "-m", "pytest", str(test_file), "-v", "--tb=short"],
+                timeout=config["sandbox_timeout"],
+                cwd=ROOT
+            )
+
+            # pytest's exit code is the authoritative outcome (0 = all
+            # passed, 5 = nothing collected, anything else = failure) —
+            # no substring scans over the output, which were also
+            # ambiguous ("1 failed, 2 passed" matches both words)
+            if returncode == 0:
+                return ValidationResult(
+                    check_name="execution_test",
+                    passed=True,
+                    score=1.0,
+                    message="Test execution successful",
+                    execution_time=time.perf_counter() - t0
+                )
+            elif returncode == 5:
+                return ValidationResult(
+                    check_name="execution_test",
+                    passed=False,
+                    score=0.5,
+                    message="Execution completed but no tests found",
+                    details={"stdout": stdout_tail[-200:]},
+                    execution_time=time.perf_counter() - t0
+                )
+            else:
+                return ValidationResult(
+                    check_name="execution_test",
+                    passed=False,
+                    score=0.0,
+                    message="Test execution failed",
+                    details={"stdout": stdout_tail[-500:], "stderr": stderr_tail[-500:]},
+                    execution_time=time.perf_counter() - t0
+                )
+
+        else:
+            # For other stacks, assume execution is OK if syntax passes
+            return ValidationResult(
+                check_name="execution_test",
+                passed=True,
+                score=0.7,
+                message=f"Execution test not available for {stack}",
+                execution_time=time.perf_counter() - t0
+            )
+
+    except subprocess.TimeoutExpired:
+        return ValidationResult(
+            check_name="execution_test",
+            passed=False,
+            score=0.0,
+            message=f"Test execution timed out after {config['sandbox_timeout']}s",
+            execution_time=time.perf_counter() - t0
+        )
+    except Exception as e:
+        return ValidationResult(
+            check_name="execution_test",
+            passed=False,
+            score=0.0,
+            message=f"Execution test failed: {str(e)}",
+            execution_time=time.perf_counter() - t0
+        )
+
+
+def _performance_check(test_file_str: str, stack: str, config: Dict[str, Any]) -> ValidationResult:
+    """Check test performance characteristics."""
+    test_file = pathlib.Path(test_file_str)
+    t0 = time.perf_counter()
+
+    # Simple performance check - measure execution time
+    if stack == "python" and test_file.suffix == ".py":
+        try:
+            _run_tail(
+                ["python", "-m", "pytest", str(test_file), "--durations=0"],
+                timeout=10,
+                cwd=ROOT
+            )
+
+            execution_time = time.perf_counter() - t0
+
+            if execution_time <= config["max_execution_time"]:
+                score = 1.0
+                message = f"Performance acceptable ({execution_time:.2f}s)"
+                passed = True
+            else:
+                score = max(0.0, 1.0 - (execution_time - config["max_execution_time"]) / 10.0)
+                message = f"Performance slow ({execution_time:.2f}s)"
+                passed = False
+
+            return ValidationResult(
+                check_name="performance_test",
+                passed=passed,
+                score=score,
+                message=message,
+                details={"execution_time": execution_time},
+                execution_time=execution_time
+            )
+
+        except Exception as e:
+            return ValidationResult(
+                check_name="performance_test",
+                passed=True,  # Non-critical
+                score=0.5,
+                message=f"Performance check failed: {str(e)}",
+                execution_time=time.perf_counter() - t0
+            )
+
+    return ValidationResult(
+        check_name="performance_test",
+        passed=True,
+        score=0.8,
+        message="Performance check not available",
+        execution_time=time.perf_counter() - t0
+    )
+
+
+# Byte substrings that count as an assertion for coverage purposes;
+# covers plain asserts, unittest-style self.assert* methods, and
+# pytest.raises blocks.
+_ASSERT_SENTINELS = (b"assert ", b"self.assert", b"pytest.raises")
+
+
+def _coverage_check(test_file_str: str, stack: str, config: Dict[str, Any]) -> ValidationResult:
+    """Check code coverage if applicable."""
+    test_file = pathlib.Path(test_file_str)
+
+    # Simplified coverage check - just verify test structure
+    try:
+        # Raw bytes: skips the UTF-8 decode, and bytes.count runs the
+        # C substring search at memory bandwidth
+        content_bytes = test_file.read_bytes()
+
+        # Count test functions
+        if stack == "python":
+            # Membership probes early-exit at the first hit, so the two
+            # cheap outcomes skip the counting scans entirely
+            if b"def test_" not in content_bytes:
+                return ValidationResult(
+                    check_name="coverage_analysis",
+                    passed=True,
+                    score=0.5,
+                    message="Coverage: no tests found",
+                )
+            if not any(sentinel in content_bytes for sentinel in _ASSERT_SENTINELS):
+                return ValidationResult(
+                    check_name="coverage_analysis",
+                    passed=False,
+                    score=0.0,
+                    message="Coverage: tests without assertions",
+                )
+
+            test_count = content_bytes.count(b"def test_")
+            assert_count = sum(content_bytes.count(sentinel)
+                               for sentinel in _ASSERT_SENTINELS)
+
+            ratio = assert_count / test_count
+            score = min(1.0, ratio / 2.0)  # Target 2+ assertions per test
+
+            return ValidationResult(
+                check_name="coverage_analysis",
+                passed=True,
+                score=score,
+                message=f"Coverage: {test_count} tests, {assert_count} assertions",
+                details={"test_count": test_count, "assert_count": assert_count}
+            )
+
+        return ValidationResult(
+            check_name="coverage_analysis",
+            passed=True,
+            score=0.7,
+            message="Coverage analysis not available",
+        )
+
+    except Exception as e:
+        return ValidationResult(
+            check_name="coverage_analysis",
+            passed=True,  # Non-critical
+            score=0.5,
+            message=f"Coverage check failed: {str(e)}"
+        )
+
+
+def _batch_java_syntax_results(
+    java_file_strs: List[str], config: Dict[str, Any]
+) -> Optional[Dict[str, ValidationResult]]:
+    """Compile all Java test files with one javac invocation.
+
+    The per-file path pays JVM startup (~500ms) and a tempdir
+    create/destroy per file; one shared tempdir and a single javac run
+    over the whole batch pays both once. Errors are attributed to files
+    by parsing javac's `path:line: error:` diagnostics. Returns None
+    when javac is unavailable so callers fall back to the per-file path.
+    """
+    t0 = time.perf_counter()
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = subprocess.run(
+                ["javac", "-cp", ".", "-d", temp_dir, *java_file_strs],
+                capture_output=True,
+                text=True,
+                timeout=15 * max(1, len(java_file_strs) // 5)
+            )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return None
+
+    elapsed = time.perf_counter() - t0
+    errors_by_file: Dict[str, List[str]] = {}
+    for line in result.stderr.splitlines():
+        path, sep, rest = line.partition(':')
+        if sep and path.endswith('.java'):
+            errors_by_file.setdefault(path, []).append(line)
+
+    results: Dict[str, ValidationResult] = {}
+    for java_file in java_file_strs:
+        errors = errors_by_file.get(java_file)
+        if errors:
+            results[java_file] = ValidationResult(
+                check_name="syntax_validation",
+                passed=False,
+                score=0.0,
+                message=f"Compilation error: {errors[0]}",
+                details={"errors": errors[:10]},
+                execution_time=elapsed
+            )
+        else:
+            results[java_file] = ValidationResult(
+                check_name="syntax_validation",
+                passed=True,
+                score=1.0,
+                message="Java compilation successful",
+                execution_time=elapsed
+            )
+    return results
+
+
+def _batch_execution_results(
+    py_file_strs: List[str], config: Dict[str, Any]
+) -> Optional[Tuple[Dict[str, ValidationResult], Dict[str, ValidationResult]]]:
+    """Run pytest once over all Python test files and split the outcomes.
+
+    One pytest invocation pays interpreter startup, plugin discovery, and
+    conftest collection a single time instead of once per file (and once
+    more for the performance pass). Returns (execution, performance)
+    ValidationResult maps keyed by file path string, or None when
+    pytest-json-report is unavailable so callers fall back to the
+    per-file subprocess path.
+    """
+    if importlib.util.find_spec("pytest_jsonreport") is None:
+        return None
+
+    t0 = time.perf_counter()
+    report_path = None
+    try:
+        fd, report_path = tempfile.mkstemp(suffix=".json", prefix="pytest_report_")
+        os.close(fd)
+        proc = subprocess.run(
+            [sys.executable, "-m", "pytest", *py_file_strs,
+             "--durations=0", "--json-report",
+             f"--json-report-file={report_path}", "--tb=short",
+             # One broken file must not abort the whole batch; its
+             # collection error is attributed per file below
+             "--continue-on-collection-errors"],
+            capture_output=True,
+            text=True,
+            # The whole batch shares one sandbox budget per file
+            timeout=config["sandbox_timeout"] * max(1, len(py_file_strs)),
+            cwd=ROOT
+        )
+        with open(report_path, encoding='utf-8') as f:
+            report = json.load(f)
+    except (subprocess.TimeoutExpired, OSError, json.JSONDecodeError):
+        return None
+    finally:
+        if report_path is not None:
+            try:
+                os.unlink(report_path)
+            except OSError:
+                pass
+
+    elapsed = time.perf_counter() - t0
+
+    # Group per-test outcomes and call durations by source file
+    outcomes_by_file: Dict[str, List[str]] = {}
+    duration_by_file: Dict[str, float] = {}
+    for test in report.get("tests", []):
+        nodeid = test.get("nodeid", "")
+        rel_file = nodeid.split("::", 1)[0]
+        abs_file = str((ROOT / rel_file).resolve())
+        outcomes_by_file.setdefault(abs_file, []).append(test.get("outcome", ""))
+        duration_by_file[abs_file] = (duration_by_file.get(abs_file, 0.0)
+                                      + test.get("call", {}).get("duration", 0.0))
+
+    # A file that errors during collection (e.g. a top-level import
+    # failure) contributes no "tests" entries, so without this it would
+    # be scored as merely having no tests. The collectors section
+    # attributes those errors per file.
+    collectors = report.get("collectors", [])
+    error_files = set()
+    for collector in collectors:
+        # A module skipped at collection (importorskip at module level)
+        # is not an error: solo, pytest exits 5 for it, so it falls
+        # through to the 0.5 "no tests found" result like the per-file
+        # path
+        if collector.get("outcome") in ("passed", "skipped"):
+            continue
+        rel_file = collector.get("nodeid", "").split("::", 1)[0]
+        if rel_file:
+            error_files.add(str((ROOT / rel_file).resolve()))
+
+    execution_results: Dict[str, ValidationResult] = {}
+    performance_results: Dict[str, ValidationResult] = {}
+    for py_file in py_file_strs:
+        key = str(pathlib.Path(py_file).resolve())
+        outcomes = outcomes_by_file.get(key)
+
+        if not outcomes:
+            # Mirror the per-file path: collection errors score 0.0,
+            # a genuinely empty file 0.5. When the report carries no
+            # collector info, fall back to the batch exit code
+            # (0 passed, 1 test failures, 5 nothing collected).
+            if key in error_files or (
+                    not collectors and proc.returncode not in (0, 1, 5)):
+                execution_results[py_file] = ValidationResult(
+                    check_name="execution_test",
+                    passed=False,
+                    score=0.0,
+                    message="Test execution failed",
+                    details={"error": "collection failed"},
+                    execution_time=elapsed
+                )
+            else:
+                execution_results[py_file] = ValidationResult(
+                    check_name="execution_test",
+                    passed=False,
+                    score=0.5,
+                    message="Execution completed but no tests found",
+                    execution_time=elapsed
+                )
+        else:
+            # Mirror pytest's exit-code semantics: skipped/xfailed (and
+            # non-strict xpassed) tests don't fail the run, only
+            # failed/error outcomes do
+            failed = sum(1 for outcome in outcomes
+                         if outcome in ("failed", "error"))
+            skipped = sum(1 for outcome in outcomes
+                          if outcome in ("skipped", "xfailed"))
+            if failed == 0:
+                execution_results[py_file] = ValidationResult(
+                    check_name="execution_test",
+                    passed=True,
+                    score=1.0,
+                    message="Test execution successful",
+                    details={"tests_run": len(outcomes), "skipped": skipped},
+                    execution_time=elapsed
+                )
+            else:
+                execution_results[py_file] = ValidationResult(
+                    check_name="execution_test",
+                    passed=False,
+                    score=0.0,
+                    message="Test execution failed",
+                    details={"tests_run": len(outcomes), "failed": failed,
+                             "skipped": skipped},
+                    execution_time=elapsed
+                )
+
+        # Performance comes from the same report's call durations, so no
+        # second pytest invocation is needed
+        file_time = duration_by_file.get(key, 0.0)
+        if file_time <= config["max_execution_time"]:
+            performance_results[py_file] = ValidationResult(
+                check_name="performance_test",
+                passed=True,
+                score=1.0,
+                message=f"Performance acceptable ({file_time:.2f}s)",
+                details={"execution_time": file_time},
+                execution_time=file_time
+            )
+        else:
+            score = max(0.0, 1.0 - (file_time - config["max_execution_time"]) / 10.0)
+            performance_results[py_file] = ValidationResult(
+                check_name="performance_test",
+                passed=False,
+                score=score,
+                message=f"Performance slow ({file_time:.2f}s)",
+                details={"execution_time": file_time},
+                execution_time=file_time
+            )
+
+    return execution_results, performance_results
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_stack_cached() -> str:
+    """Detect the project stack from marker files in the repo root.
+
+    One scandir pass replaces five per-file exists() stat calls, and the
+    result is memoized — the answer can't change mid-run, and
+    evaluate_tests may be called in a loop over many file sets.
+    """
+    try:
+        root_names = {entry.name for entry in os.scandir(ROOT)}
+    except OSError:
+        return "unknown"
+    if "requirements.txt" in root_names or "pyproject.toml" in root_names:
+        return "python"
+    elif "package.json" in root_names:
+        return "node"
+    elif "pom.xml" in root_names or "build.gradle" in root_names:
+        return "java"
+    return "unknown"
+
+
+# Check-name dispatch table for the parallel executor. HITL approval is
+# repository-global and stays on the main process.
+_CHECK_DISPATCH = {
+    "syntax_validation": _syntax_check,
+    "policy_compliance": _policy_check,
+    "import_validation": _import_check,
+    "execution_test": _execution_check,
+    "performance_test": _performance_check,
+    "coverage_analysis": _coverage_check,
+}
+
+# Prerequisites per check: a file that fails syntax can't be imported or
+# executed, so spending a pytest subprocess on it is guaranteed waste.
+# Dependents of a failed prerequisite are recorded as skipped instead.
+_CHECK_DEPS = {
+    "import_validation": frozenset({"syntax_validation"}),
+    "execution_test": frozenset({"syntax_validation"}),
+    "performance_test": frozenset({"syntax_validation"}),
+}
+
+
+class _WeightDict(dict):
+    """Scoring weights with a C-level default for unknown check names."""
+
+    def __missing__(self, key):
+        return 0.05
+
+
 class TestEvaluationHarness:
     """Comprehensive test validation pipeline."""
-    
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or self.default_config()
         self.results: List[ValidationResult] = []
+        # Built once so the scoring loop does a plain subscript instead
+        # of .get with a default per result
+        self._weights = _WeightDict(self.config["scoring_weights"])
         
     def default_config(self) -> Dict[str, Any]:
         """Default evaluation configuration."""
@@ -81,7 +923,8 @@ class TestEvaluationHarness:
             },
             "pass_threshold": 0.8,  # Overall score needed to pass
             "sandbox_timeout": 30,   # seconds
-            "max_execution_time": 5.0  # seconds per test
+            "max_execution_time": 5.0,  # seconds per test
+            "precompile_bytecode": True  # warm .pyc before fan-out
         }
     
     def evaluate_tests(self, test_files: List[pathlib.Path], 
@@ -96,60 +939,143 @@ class TestEvaluationHarness:
         
         # Detect stack if not provided
         stack = context.get("stack") if context else self._detect_stack()
-        
-        # Run all validation checks
+
+        # Pre-compile test bytecode once before fanning out: without
+        # this, every pool worker's pytest subprocess races to compile
+        # the same conftests and helpers on first import. compileall
+        # skips files whose cached .pyc is already fresh.
+        if stack == "python" and self.config.get("precompile_bytecode", True):
+            tests_dir = ROOT / "tests"
+            if tests_dir.is_dir():
+                compileall.compile_dir(str(tests_dir), quiet=2, workers=0)
+
+        # Build the per-file work list in the usual check order
+        per_file_checks = [
+            name for name in ("syntax_validation", "policy_compliance",
+                              "import_validation", "execution_test")
+            if name in self.config["required_checks"]
+        ] + [
+            name for name in ("performance_test", "coverage_analysis")
+            if name in self.config["optional_checks"]
+        ]
+
+        pairs = [(test_file, check_name)
+                 for test_file in test_files
+                 for check_name in per_file_checks]
         for test_file in test_files:
             print(f"📝 Evaluating: {test_file.name}")
-            
-            # Required checks
-            if "syntax_validation" in self.config["required_checks"]:
-                result = self._check_syntax(test_file, stack)
-                self.results.append(result)
-            
-            if "policy_compliance" in self.config["required_checks"]:
-                result = self._check_policy_compliance(test_file)
-                self.results.append(result)
-            
-            if "import_validation" in self.config["required_checks"]:
-                result = self._check_imports(test_file, stack)
-                self.results.append(result)
-            
-            if "execution_test" in self.config["required_checks"]:
-                result = self._check_execution(test_file, stack)
-                self.results.append(result)
-            
-            # Optional checks
-            if "performance_test" in self.config["optional_checks"]:
-                result = self._check_performance(test_file, stack)
-                self.results.append(result)
-            
-            if "coverage_analysis" in self.config["optional_checks"]:
-                result = self._check_coverage(test_file, stack)
-                self.results.append(result)
-        
+
+        by_pair: Dict[Tuple[str, str], ValidationResult] = {}
+
+        # Checks are independent per (file, check) pair and dominated by
+        # subprocess pytest runs and parsing, so processes — not threads
+        # — give near-linear scaling. The executor hands work to idle
+        # workers dynamically, and results come back in submission order.
+        def _run_items(items: List[Tuple[pathlib.Path, str]]) -> None:
+            if len(items) >= _PARALLEL_MIN_ITEMS:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    futures = [
+                        executor.submit(_CHECK_DISPATCH[check_name],
+                                        str(test_file), stack, self.config)
+                        for test_file, check_name in items
+                    ]
+                    dispatched = [future.result() for future in futures]
+            else:
+                dispatched = [
+                    _CHECK_DISPATCH[check_name](str(test_file), stack, self.config)
+                    for test_file, check_name in items
+                ]
+            by_pair.update(zip(((str(f), c) for f, c in items), dispatched))
+
+        # Java syntax checks batch into one javac run over a shared
+        # tempdir: one JVM startup for the whole suite instead of one
+        # per file. Per-file checks remain the fallback.
+        if stack == "java" and "syntax_validation" in per_file_checks:
+            java_file_strs = [str(f) for f in test_files if f.suffix == ".java"]
+            if java_file_strs:
+                java_batch = _batch_java_syntax_results(java_file_strs, self.config)
+                if java_batch is not None:
+                    for java_file in java_file_strs:
+                        by_pair[(java_file, "syntax_validation")] = java_batch[java_file]
+
+        # Stage one: prerequisite checks. Running these first lets the
+        # expensive dependents (pytest subprocesses on unparsable files)
+        # be skipped outright instead of failing slowly.
+        prereq_names = {name for deps in _CHECK_DEPS.values() for name in deps}
+        stage_one = [name for name in per_file_checks if name in prereq_names]
+        stage_two = [name for name in per_file_checks if name not in prereq_names]
+        _run_items([(test_file, check_name)
+                    for test_file in test_files for check_name in stage_one
+                    if (str(test_file), check_name) not in by_pair])
+
+        failed_prereqs = {
+            str(test_file): {name for name in stage_one
+                             if not by_pair[(str(test_file), name)].passed}
+            for test_file in test_files
+        }
+
+        # Mark dependents of a failed prerequisite as skipped
+        for test_file in test_files:
+            failed = failed_prereqs[str(test_file)]
+            for check_name in stage_two:
+                blocked = _CHECK_DEPS.get(check_name, frozenset()) & failed
+                if blocked:
+                    by_pair[(str(test_file), check_name)] = ValidationResult(
+                        check_name=check_name,
+                        passed=False,
+                        score=0.0,
+                        message=f"Skipped: {min(blocked)} failed",
+                    )
+
+        # Execution and performance for Python files share a single batch
+        # pytest run: one interpreter/plugin/conftest startup for the
+        # whole suite, with per-file outcomes and call durations read
+        # back from the JSON report. Falls back to the per-file
+        # subprocess checks when pytest-json-report isn't installed.
+        if stack == "python":
+            wanted = [name for name in ("execution_test", "performance_test")
+                      if name in stage_two]
+            py_file_strs = [str(f) for f in test_files
+                            if f.suffix == ".py" and not failed_prereqs[str(f)]]
+            if wanted and py_file_strs:
+                batch = _batch_execution_results(py_file_strs, self.config)
+                if batch is not None:
+                    exec_map, perf_map = batch
+                    for py_file in py_file_strs:
+                        if "execution_test" in wanted:
+                            by_pair[(py_file, "execution_test")] = exec_map[py_file]
+                        if "performance_test" in wanted:
+                            by_pair[(py_file, "performance_test")] = perf_map[py_file]
+
+        # Stage two: everything not already answered by a skip or the
+        # batch run
+        _run_items([(test_file, check_name) for test_file, check_name in pairs
+                    if (str(test_file), check_name) not in by_pair])
+
+        # Reassemble in canonical (file, check) order regardless of which
+        # path produced each result
+        self.results = [by_pair[(str(f), c)] for f, c in pairs]
+
         # Check HITL approval status
         if "hitl_approval" in self.config["optional_checks"]:
             result = self._check_hitl_approval()
             self.results.append(result)
         
-        # Calculate overall score and pass/fail
-        overall_score = self._calculate_overall_score()
+        # Score, summary, and recommendations from one results pass
+        overall_score, passed_checks, summary, recommendations = self._finalize()
         overall_passed = overall_score >= self.config["pass_threshold"]
-        
-        # Generate recommendations
-        recommendations = self._generate_recommendations()
-        
+
         # Create evaluation report
         report = EvaluationReport(
             timestamp=start_time.isoformat() + "Z",
             repository_root=str(ROOT),
             stack=stack,
             total_checks=len(self.results),
-            passed_checks=sum(1 for r in self.results if r.passed),
+            passed_checks=passed_checks,
             overall_score=overall_score,
             overall_passed=overall_passed,
             validation_results=self.results,
-            summary=self._generate_summary(),
+            summary=summary,
             recommendations=recommendations
         )
         
@@ -160,392 +1086,62 @@ class TestEvaluationHarness:
     
     def _detect_stack(self) -> str:
         """Detect project stack."""
-        if (ROOT / "requirements.txt").exists() or (ROOT / "pyproject.toml").exists():
-            return "python"
-        elif (ROOT / "package.json").exists():
-            return "node"
-        elif (ROOT / "pom.xml").exists() or (ROOT / "build.gradle").exists():
-            return "java"
-        return "unknown"
-    
+        return _detect_stack_cached()
+
+    # Thin delegates kept for callers that validate a single file; the
+    # real check logic lives in the module-level functions above.
+
     def _check_syntax(self, test_file: pathlib.Path, stack: str) -> ValidationResult:
         """Check syntax validity using language-specific tools."""
-        
-        start_time = datetime.utcnow()
-        
-        try:
-            if stack == "python" and test_file.suffix == ".py":
-                # Use AST parsing for Python
-                import ast
-                content = test_file.read_text()
-                ast.parse(content)
-                
-                return ValidationResult(
-                    check_name="syntax_validation",
-                    passed=True,
-                    score=1.0,
-                    message="Python syntax is valid",
-                    execution_time=(datetime.utcnow() - start_time).total_seconds()
-                )
-            
-            elif stack == "node" and test_file.suffix in [".js", ".ts"]:
-                # Use node --check for JavaScript
-                result = subprocess.run(
-                    ["node", "--check", str(test_file)],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                
-                if result.returncode == 0:
-                    return ValidationResult(
-                        check_name="syntax_validation", 
-                        passed=True,
-                        score=1.0,
-                        message="JavaScript syntax is valid",
-                        execution_time=(datetime.utcnow() - start_time).total_seconds()
-                    )
-                else:
-                    return ValidationResult(
-                        check_name="syntax_validation",
-                        passed=False,
-                        score=0.0,
-                        message=f"Syntax error: {result.stderr}",
-                        execution_time=(datetime.utcnow() - start_time).total_seconds()
-                    )
-            
-            elif stack == "java" and test_file.suffix == ".java":
-                # Use javac for Java (compilation check)
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    result = subprocess.run(
-                        ["javac", "-cp", ".", "-d", temp_dir, str(test_file)],
-                        capture_output=True,
-                        text=True,
-                        timeout=15
-                    )
-                    
-                    if result.returncode == 0:
-                        return ValidationResult(
-                            check_name="syntax_validation",
-                            passed=True,
-                            score=1.0,
-                            message="Java compilation successful",
-                            execution_time=(datetime.utcnow() - start_time).total_seconds()
-                        )
-                    else:
-                        return ValidationResult(
-                            check_name="syntax_validation",
-                            passed=False,
-                            score=0.0,
-                            message=f"Compilation error: {result.stderr}",
-                            execution_time=(datetime.utcnow() - start_time).total_seconds()
-                        )
-            
-            else:
-                # Unknown or unsupported file type
-                return ValidationResult(
-                    check_name="syntax_validation",
-                    passed=True,
-                    score=0.5,
-                    message=f"Syntax check not available for {stack}/{test_file.suffix}",
-                    execution_time=(datetime.utcnow() - start_time).total_seconds()
-                )
-        
-        except Exception as e:
-            return ValidationResult(
-                check_name="syntax_validation",
-                passed=False,
-                score=0.0,
-                message=f"Syntax check failed: {str(e)}",
-                execution_time=(datetime.utcnow() - start_time).total_seconds()
-            )
-    
+        return _syntax_check(str(test_file), stack, self.config)
+
     def _check_policy_compliance(self, test_file: pathlib.Path) -> ValidationResult:
         """Check policy compliance using policy checker."""
-        
-        start_time = datetime.utcnow()
-        
-        try:
-            # Import and run policy checker
-            sys.path.append(str(ROOT))
-            from tools.policy_checker_v2 import TestPolicyChecker
-            
-            checker = TestPolicyChecker()
-            violations = checker.check_file(test_file)
-            
-            # Calculate score based on violations
-            error_count = sum(1 for v in violations if v.severity == "error")
-            warning_count = sum(1 for v in violations if v.severity == "warning")
-            
-            # Score: 1.0 for no issues, deduct for errors/warnings
-            score = max(0.0, 1.0 - (error_count * 0.2) - (warning_count * 0.1))
-            passed = error_count == 0
-            
-            message = f"Policy check: {error_count} errors, {warning_count} warnings"
-            if violations:
-                message += f" (first: {violations[0].message})"
-            
-            return ValidationResult(
-                check_name="policy_compliance",
-                passed=passed,
-                score=score,
-                message=message,
-                details={"violations": len(violations), "errors": error_count, "warnings": warning_count},
-                execution_time=(datetime.utcnow() - start_time).total_seconds()
-            )
-        
-        except Exception as e:
-            return ValidationResult(
-                check_name="policy_compliance",
-                passed=False,
-                score=0.0,
-                message=f"Policy check failed: {str(e)}",
-                execution_time=(datetime.utcnow() - start_time).total_seconds()
-            )
-    
+        return _policy_check(str(test_file), "python", self.config)
+
     def _check_imports(self, test_file: pathlib.Path, stack: str) -> ValidationResult:
         """Check if all imports are valid and available."""
-        
-        start_time = datetime.utcnow()
-        
-        try:
-            if stack == "python" and test_file.suffix == ".py":
-                import ast
-                
-                content = test_file.read_text()
-                tree = ast.parse(content)
-                
-                missing_imports = []
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            try:
-                                __import__(alias.name)
-                            except ImportError:
-                                missing_imports.append(alias.name)
-                    
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            try:
-                                __import__(node.module)
-                            except ImportError:
-                                missing_imports.append(node.module)
-                
-                if missing_imports:
-                    return ValidationResult(
-                        check_name="import_validation",
-                        passed=False,
-                        score=0.5,  # Partial score - syntax is OK but imports missing
-                        message=f"Missing imports: {', '.join(missing_imports[:3])}",
-                        details={"missing_imports": missing_imports},
-                        execution_time=(datetime.utcnow() - start_time).total_seconds()
-                    )
-                else:
-                    return ValidationResult(
-                        check_name="import_validation",
-                        passed=True,
-                        score=1.0,
-                        message="All imports are valid",
-                        execution_time=(datetime.utcnow() - start_time).total_seconds()
-                    )
-            
-            else:
-                # For non-Python files, assume imports are OK if syntax passes
-                return ValidationResult(
-                    check_name="import_validation",
-                    passed=True,
-                    score=0.8,  # Partial score since we can't fully validate
-                    message=f"Import validation not available for {stack}",
-                    execution_time=(datetime.utcnow() - start_time).total_seconds()
-                )
-        
-        except Exception as e:
-            return ValidationResult(
-                check_name="import_validation",
-                passed=False,
-                score=0.0,
-                message=f"Import check failed: {str(e)}",
-                execution_time=(datetime.utcnow() - start_time).total_seconds()
-            )
-    
+        return _import_check(str(test_file), stack, self.config)
+
     def _check_execution(self, test_file: pathlib.Path, stack: str) -> ValidationResult:
         """Test execution in sandboxed environment."""
-        
-        start_time = datetime.utcnow()
-        
-        try:
-            if stack == "python" and test_file.suffix == ".py":
-                # Run pytest on the file
-                result = subprocess.run(
-                    ["python", "-m", "pytest", str(test_file), "-v", "--tb=short"],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.config["sandbox_timeout"],
-                    cwd=ROOT
-                )
-                
-                # Parse pytest output
-                if "FAILED" in result.stdout or result.returncode != 0:
-                    return ValidationResult(
-                        check_name="execution_test",
-                        passed=False,
-                        score=0.0,
-                        message="Test execution failed",
-                        details={"stdout": result.stdout[-500:], "stderr": result.stderr[-500:]},
-                        execution_time=(datetime.utcnow() - start_time).total_seconds()
-                    )
-                elif "passed" in result.stdout:
-                    return ValidationResult(
-                        check_name="execution_test",
-                        passed=True,
-                        score=1.0,
-                        message="Test execution successful",
-                        details={"stdout": result.stdout[-200:]},
-                        execution_time=(datetime.utcnow() - start_time).total_seconds()
-                    )
-                else:
-                    return ValidationResult(
-                        check_name="execution_test",
-                        passed=False,
-                        score=0.5,
-                        message="Execution completed but no tests found",
-                        details={"stdout": result.stdout[-200:]},
-                        execution_time=(datetime.utcnow() - start_time).total_seconds()
-                    )
-            
-            else:
-                # For other stacks, assume execution is OK if syntax passes
-                return ValidationResult(
-                    check_name="execution_test",
-                    passed=True,
-                    score=0.7,
-                    message=f"Execution test not available for {stack}",
-                    execution_time=(datetime.utcnow() - start_time).total_seconds()
-                )
-        
-        except subprocess.TimeoutExpired:
-            return ValidationResult(
-                check_name="execution_test",
-                passed=False,
-                score=0.0,
-                message=f"Test execution timed out after {self.config['sandbox_timeout']}s",
-                execution_time=(datetime.utcnow() - start_time).total_seconds()
-            )
-        except Exception as e:
-            return ValidationResult(
-                check_name="execution_test",
-                passed=False,
-                score=0.0,
-                message=f"Execution test failed: {str(e)}",
-                execution_time=(datetime.utcnow() - start_time).total_seconds()
-            )
-    
+        return _execution_check(str(test_file), stack, self.config)
+
     def _check_performance(self, test_file: pathlib.Path, stack: str) -> ValidationResult:
         """Check test performance characteristics."""
-        
-        start_time = datetime.utcnow()
-        
-        # Simple performance check - measure execution time
-        if stack == "python" and test_file.suffix == ".py":
-            try:
-                result = subprocess.run(
-                    ["python", "-m", "pytest", str(test_file), "--durations=0"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=ROOT
-                )
-                
-                execution_time = (datetime.utcnow() - start_time).total_seconds()
-                
-                if execution_time <= self.config["max_execution_time"]:
-                    score = 1.0
-                    message = f"Performance acceptable ({execution_time:.2f}s)"
-                    passed = True
-                else:
-                    score = max(0.0, 1.0 - (execution_time - self.config["max_execution_time"]) / 10.0)
-                    message = f"Performance slow ({execution_time:.2f}s)"
-                    passed = False
-                
-                return ValidationResult(
-                    check_name="performance_test",
-                    passed=passed,
-                    score=score,
-                    message=message,
-                    details={"execution_time": execution_time},
-                    execution_time=execution_time
-                )
-            
-            except Exception as e:
-                return ValidationResult(
-                    check_name="performance_test",
-                    passed=True,  # Non-critical
-                    score=0.5,
-                    message=f"Performance check failed: {str(e)}",
-                    execution_time=(datetime.utcnow() - start_time).total_seconds()
-                )
-        
-        return ValidationResult(
-            check_name="performance_test",
-            passed=True,
-            score=0.8,
-            message="Performance check not available",
-            execution_time=(datetime.utcnow() - start_time).total_seconds()
-        )
-    
+        return _performance_check(str(test_file), stack, self.config)
+
     def _check_coverage(self, test_file: pathlib.Path, stack: str) -> ValidationResult:
         """Check code coverage if applicable."""
-        
-        # Simplified coverage check - just verify test structure
-        try:
-            content = test_file.read_text()
-            
-            # Count test functions
-            if stack == "python":
-                test_count = content.count("def test_")
-                assert_count = content.count("assert ")
-                
-                if test_count > 0 and assert_count > 0:
-                    ratio = assert_count / test_count
-                    score = min(1.0, ratio / 2.0)  # Target 2+ assertions per test
-                    
-                    return ValidationResult(
-                        check_name="coverage_analysis",
-                        passed=True,
-                        score=score,
-                        message=f"Coverage: {test_count} tests, {assert_count} assertions",
-                        details={"test_count": test_count, "assert_count": assert_count}
-                    )
-            
-            return ValidationResult(
-                check_name="coverage_analysis",
-                passed=True,
-                score=0.7,
-                message="Coverage analysis not available",
-            )
-        
-        except Exception as e:
-            return ValidationResult(
-                check_name="coverage_analysis",
-                passed=True,  # Non-critical
-                score=0.5,
-                message=f"Coverage check failed: {str(e)}"
-            )
-    
+        return _coverage_check(str(test_file), stack, self.config)
+
     def _check_hitl_approval(self) -> ValidationResult:
         """Check if HITL approval exists for generated tests."""
-        
+
         try:
-            # Look for approved HITL reviews
-            approved_reviews = []
-            for artifact_file in ARTIFACTS.glob("hitl_review_*.json"):
-                try:
-                    artifact = json.loads(artifact_file.read_text())
-                    if artifact.get("status") == "approved":
-                        approved_reviews.append(artifact["id"])
-                except Exception:
-                    continue
-            
+            # The validator appends every status change to
+            # hitl_index.jsonl (latest line per id wins), so approval is
+            # answered from one small file instead of opening and
+            # parsing every hitl_review_*.json artifact. A missing
+            # index is materialized once from the existing artifacts.
+            index_path = ARTIFACTS / "hitl_index.jsonl"
+            if not index_path.exists():
+                self._migrate_hitl_index(index_path)
+
+            status_by_id = {}
+            try:
+                with index_path.open(encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            record = json.loads(line)
+                            status_by_id[record["id"]] = record["status"]
+            except OSError:
+                pass
+
+            approved_reviews = [review_id for review_id, status in status_by_id.items()
+                                if status == "approved"]
+
             if approved_reviews:
                 return ValidationResult(
                     check_name="hitl_approval",
@@ -569,90 +1165,122 @@ class TestEvaluationHarness:
                 score=0.0,
                 message=f"HITL check failed: {str(e)}"
             )
-    
-    def _calculate_overall_score(self) -> float:
-        """Calculate weighted overall score."""
-        
+
+    @staticmethod
+    def _migrate_hitl_index(index_path: pathlib.Path) -> None:
+        """One-shot migration: build the index from legacy artifacts."""
+        lines = []
+        for artifact_file in ARTIFACTS.glob("hitl_review_*.json"):
+            try:
+                artifact = json.loads(artifact_file.read_text())
+                lines.append(json.dumps({"id": artifact["id"],
+                                         "status": artifact.get("status", "pending_review")}))
+            except Exception:
+                continue
+        try:
+            index_path.write_text("\n".join(lines) + ("\n" if lines else ""),
+                                  encoding='utf-8')
+        except OSError:
+            pass
+
+    def _finalize(self) -> Tuple[float, int, Dict[str, Any], List[str]]:
+        """Aggregate score, summary, and recommendations in one pass.
+
+        The weighted score, per-category summary, total execution time,
+        critical failures, and every recommendation trigger are all
+        simple accumulations, so one loop over self.results replaces the
+        five or six separate passes the old per-purpose methods made.
+        Returns (overall_score, passed_checks, summary, recommendations).
+        """
+        required_checks = self.config["required_checks"]
+        weights = self._weights
+
+        by_category: Dict[str, Dict[str, Any]] = {}
         total_weight = 0.0
         weighted_score = 0.0
-        
+        total_time = 0.0
+        passed_checks = 0
+        critical_failures = []
+        policy_failures = 0
+        slow_performance = 0
+        hitl_failures = 0
+
         for result in self.results:
-            weight = self.config["scoring_weights"].get(result.check_name, 0.05)
+            name = result.check_name
+            stats = by_category.setdefault(
+                name, {"passed": 0, "total": 0, "avg_score": 0.0})
+            stats["total"] += 1
+            if result.passed:
+                stats["passed"] += 1
+                passed_checks += 1
+            stats["avg_score"] += result.score
+
+            weight = weights[name]
             total_weight += weight
             weighted_score += result.score * weight
-        
-        if total_weight > 0:
-            return weighted_score / total_weight
-        else:
-            return 0.0
-    
-    def _generate_summary(self) -> Dict[str, Any]:
-        """Generate evaluation summary."""
-        
-        by_category = {}
-        for result in self.results:
-            category = result.check_name
-            if category not in by_category:
-                by_category[category] = {"passed": 0, "total": 0, "avg_score": 0.0}
-            
-            by_category[category]["total"] += 1
-            if result.passed:
-                by_category[category]["passed"] += 1
-            by_category[category]["avg_score"] += result.score
-        
-        # Calculate averages
-        for category in by_category:
-            total = by_category[category]["total"]
-            by_category[category]["avg_score"] /= total if total > 0 else 1
-        
-        return {
+            total_time += result.execution_time
+
+            if not result.passed and name in required_checks:
+                critical_failures.append(name)
+            if name == "policy_compliance" and not result.passed:
+                policy_failures += 1
+            if name == "performance_test" and result.score < 0.8:
+                slow_performance += 1
+            if name == "hitl_approval" and not result.passed:
+                hitl_failures += 1
+
+        for stats in by_category.values():
+            stats["avg_score"] /= stats["total"] if stats["total"] > 0 else 1
+
+        overall_score = weighted_score / total_weight if total_weight > 0 else 0.0
+
+        summary = {
             "by_category": by_category,
-            "total_execution_time": sum(r.execution_time for r in self.results),
-            "critical_failures": [r.check_name for r in self.results 
-                                 if not r.passed and r.check_name in self.config["required_checks"]]
+            "total_execution_time": total_time,
+            "critical_failures": critical_failures,
         }
-    
-    def _generate_recommendations(self) -> List[str]:
-        """Generate improvement recommendations."""
-        
+
         recommendations = []
-        
-        # Check for critical failures
-        failed_required = [r for r in self.results 
-                          if not r.passed and r.check_name in self.config["required_checks"]]
-        
-        if failed_required:
+        if critical_failures:
             recommendations.append("❌ Fix critical validation failures before merging")
-        
-        # Check for policy violations
-        policy_results = [r for r in self.results if r.check_name == "policy_compliance"]
-        for result in policy_results:
-            if not result.passed:
-                recommendations.append("⚠️ Address policy violations for better test quality")
-        
-        # Check performance
-        perf_results = [r for r in self.results if r.check_name == "performance_test"]
-        for result in perf_results:
-            if result.score < 0.8:
-                recommendations.append("🐌 Optimize test performance to reduce execution time")
-        
-        # Check HITL approval
-        hitl_results = [r for r in self.results if r.check_name == "hitl_approval"]
-        for result in hitl_results:
-            if not result.passed:
-                recommendations.append("👥 Obtain human approval before merging")
-        
+        recommendations.extend(
+            ["⚠️ Address policy violations for better test quality"] * policy_failures)
+        recommendations.extend(
+            ["🐌 Optimize test performance to reduce execution time"] * slow_performance)
+        recommendations.extend(
+            ["👥 Obtain human approval before merging"] * hitl_failures)
         if not recommendations:
             recommendations.append("✅ All checks passed - ready for merge!")
-        
-        return recommendations
-    
+
+        return overall_score, passed_checks, summary, recommendations
+
     def _save_report(self, report: EvaluationReport) -> None:
         """Save evaluation report to artifacts."""
-        
-        report_path = ARTIFACTS / f"evaluation_report_{int(datetime.utcnow().timestamp())}.json"
-        report_path.write_text(json.dumps(asdict(report), indent=2, default=str))
-        
+
+        # Content-addressed filename: second-resolution timestamps
+        # collide under tight loops and parallel invocations, and
+        # identical reports were stored twice. Hashing the body makes
+        # the name collision-free, deduplicates repeats, and the
+        # temp-file + os.replace write is safe under concurrency.
+        body = _dump_report_bytes(report)
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        report_path = ARTIFACTS / f"evaluation_report_{digest}.json"
+        if not report_path.exists():
+            tmp_path = report_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, report_path)
+
+        # Stable pointer to the most recent report
+        latest = ARTIFACTS / "evaluation_report_latest.json"
+        try:
+            latest.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            latest.symlink_to(report_path.name)
+        except OSError:
+            pass  # e.g. filesystems without symlink support
+
         print(f"📊 Evaluation report saved: {report_path}")
 
 def main():
@@ -701,7 +1329,7 @@ def main():
     
     # Save custom output
     if args.output:
-        pathlib.Path(args.output).write_text(json.dumps(asdict(report), indent=2, default=str))
+        pathlib.Path(args.output).write_bytes(_dump_report_bytes(report))
         print(f"\n📄 Report saved to: {args.output}")
     
     # Exit with appropriate code
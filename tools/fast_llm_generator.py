@@ -6,43 +6,164 @@ Fast LLM Test Generator
 Optimized for speed with minimal prompts and focused generation.
 """
 
+import hashlib
 import json
+import re
 import requests
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - requirements.txt pins orjson
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[1]
 
+# JSON (de)serialization helpers: orjson is markedly faster than the
+# stdlib on both paths, which matters most for the many small
+# per-chunk loads in the streaming response loop.
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Concurrent generations in flight; match the Ollama server's
+# OLLAMA_NUM_PARALLEL setting for full overlap.
+_NUM_PARALLEL = max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+
+# One pooled session for every Ollama call: bare requests.get/post open
+# (and tear down) a fresh TCP connection per request, paying the
+# handshake again for every file. Pool size covers the thread fan-out.
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=10, pool_maxsize=10, max_retries=0)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+SESSION.headers.update({
+    'Connection': 'keep-alive',
+    'Accept-Encoding': 'gzip, deflate',
+})
+
+# Constant instruction block shared verbatim across every file. It
+# leads the prompt so Ollama's prefix KV-cache covers it: only the
+# per-file tail below is re-processed on subsequent calls.
+PROMPT_PREFIX = """Generate pytest tests for the module described below.
+
+Requirements:
+1. Import: from <target module> import *
+2. Simple test functions only
+3. Basic assertions
+4. No complex mocking
+
+Generate 2-3 test functions maximum.
+
+"""
+
+# Rough token count of the shared prefix (~4 chars/token); passed as
+# num_keep so the server pins these KV entries across calls.
+_PREFIX_TOKENS = len(PROMPT_PREFIX) // 4
+
+# Static prompt pieces and stop strings, built once instead of
+# re-parsed/re-allocated on every call
+_PROMPT_TARGET = "Target module: {module} (import with: from {module} import *)\n\nFunctions to test:"
+_PROMPT_TAIL = "\n\nTests:"
+_STOP = ("\n\nclass", "\n\ndef test_test_")
+
+
+# On-disk response cache: re-running generation after an unrelated edit
+# repays the full multi-second LLM call for identical prompts. Entries
+# are keyed by a hash of everything that shapes the response (model,
+# prompt, and the generation options, which are constants here) and
+# expire after a day.
+_RESPONSE_CACHE_DIR = ROOT / "genai_artifacts" / "llm_cache"
+_RESPONSE_CACHE_TTL = 86400  # seconds
+
+
+def _response_cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(
+        f"{model}|ctx=2048|predict=500|temp=0.0|{prompt}".encode('utf-8')
+    ).hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[str]:
+    path = _RESPONSE_CACHE_DIR / f"{key}.py"
+    try:
+        if time.time() - path.stat().st_mtime <= _RESPONSE_CACHE_TTL:
+            return path.read_text(encoding='utf-8')
+    except OSError:
+        pass
+    return None
+
+
+def _response_cache_put(key: str, code: str) -> None:
+    try:
+        _RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _RESPONSE_CACHE_DIR / f"{key}.py"
+        tmp_path = path.with_suffix('.py.tmp')
+        tmp_path.write_text(code, encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Cache is best-effort
+
+
+# Health-probe cache: the /api/tags state rarely changes within a
+# session, so repeated invocations (CI driving several context batches)
+# shouldn't pay an extra round-trip each time.
+_HEALTH = {'ts': 0.0, 'ok': False}
+_HEALTH_TTL = 60  # seconds
+
+
+def _ollama_available(ollama_host: str) -> bool:
+    if os.getenv("OLLAMA_SKIP_HEALTH") == "1":
+        return True
+    if time.time() - _HEALTH['ts'] < _HEALTH_TTL:
+        return _HEALTH['ok']
+    try:
+        response = SESSION.get(f"{ollama_host}/api/tags", timeout=3)
+        ok = response.status_code == 200
+    except Exception:
+        ok = False
+    _HEALTH.update(ts=time.time(), ok=ok)
+    return ok
+
+
+def _should_stop(text: str) -> bool:
+    """Client-side stop: a closed ```python fence means the tests are done."""
+    return text.count("```") >= 2
+
+
 def generate_minimal_prompt(file_info: Dict[str, Any]) -> str:
     """Create a minimal, focused prompt for fast generation."""
-    
+
     functions = file_info.get("functions", [])
     classes = file_info.get("classes", [])
     module = file_info.get("module", "")
-    
-    prompt = f"""Generate pytest tests for {module}:
 
-Functions to test:"""
-    
+    parts = [PROMPT_PREFIX, _PROMPT_TARGET.format(module=module)]
+
     for func in functions[:2]:  # Only 2 functions max
-        prompt += f"\n- {func['name']}: {func['docstring'][:50]}..."
-    
+        parts.append(f"\n- {func['name']}: {func['docstring'][:50]}...")
+
     for cls in classes[:1]:  # Only 1 class max
         methods = ", ".join(cls['methods'][:3])
-        prompt += f"\nClass {cls['name']} methods: {methods}"
-    
-    prompt += f"""
+        parts.append(f"\nClass {cls['name']} methods: {methods}")
 
-Requirements:
-1. Import: from {module} import *
-2. Simple test functions only
-3. Basic assertions
-4. No complex mocking
+    parts.append(_PROMPT_TAIL)
 
-Generate 2-3 test functions maximum:"""
-    
-    return prompt
+    return "".join(parts)
 
 def fast_llm_generate(context: Dict[str, Any]) -> int:
     """Generate tests quickly with minimal prompts."""
@@ -50,79 +171,209 @@ def fast_llm_generate(context: Dict[str, Any]) -> int:
     ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
     model = os.getenv("OLLAMA_MODEL", "qwen2.5-coder:7b")  # Use available model
     
-    # Test connection
-    try:
-        response = requests.get(f"{ollama_host}/api/tags", timeout=3)
-        if response.status_code != 200:
-            print(f":: Ollama not available")
-            return 0
-    except Exception:
-        print(f":: Ollama connection failed")
+    # Test connection (cached for a minute between invocations)
+    if not _ollama_available(ollama_host):
+        print(f":: Ollama not available")
         return 0
-    
+
     generated_count = 0
     test_dir = ROOT / "tests" / "fast_generated"
     test_dir.mkdir(exist_ok=True)
-    
+
     files = context.get("files", [])
-    
-    for file_info in files[:2]:  # Process maximum 2 files
-        print(f":: Fast generating for {file_info['file']}...")
-        
-        # Create minimal prompt
-        prompt = generate_minimal_prompt(file_info)
-        
-        try:
-            # Fast generation with tight constraints
-            response = requests.post(
-                f"{ollama_host}/api/generate",
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.0,    # Deterministic
-                        "top_p": 0.8,
-                        "num_ctx": 2048,       # Very small context
-                        "num_predict": 500,    # Limit output length
-                        "stop": ["\n\nclass", "\n\ndef test_test_"]  # Stop early
-                    }
-                },
-                timeout=30  # Short timeout
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                generated_code = result.get("response", "").strip()
-                
-                # Clean markdown
-                if "```python" in generated_code:
-                    generated_code = generated_code.split("```python")[1].split("```")[0].strip()
-                elif "```" in generated_code:
-                    generated_code = generated_code.split("```")[1].strip()
-                
-                if generated_code and "def test_" in generated_code:
-                    # Save test file
-                    module_name = file_info['module'].split('.')[-1]
-                    test_file = test_dir / f"test_{module_name}_fast.py"
-                    test_file.write_text(generated_code, encoding='utf-8')
-                    print(f":: ✅ Generated {test_file}")
-                    generated_count += 1
-                else:
-                    print(f":: ❌ No valid tests for {file_info['file']}")
-            else:
-                print(f":: ❌ API error: {response.status_code}")
-                
-        except requests.exceptions.Timeout:
-            print(f":: ⏰ Timeout for {file_info['file']}")
-            continue
-        except Exception as e:
-            print(f":: 💥 Error for {file_info['file']}: {e}")
-            continue
-    
+
+    # Generation is bound by the Ollama server, not this process:
+    # issuing the per-file requests from worker threads overlaps their
+    # network and GPU time, so wall clock approaches the slowest single
+    # call instead of the sum.
+    targets = files[:2]  # Process maximum 2 files
+
+    # FAST_LLM_BATCH=1 packs the batch into one request — one prompt
+    # eval for all modules — at the cost of per-file streaming/caching
+    if os.getenv("FAST_LLM_BATCH") == "1" and len(targets) > 1:
+        generated_count = _generate_batched(targets, ollama_host, model, test_dir)
+        print(f":: Fast generation completed: {generated_count} files")
+        return generated_count
+
+    with ThreadPoolExecutor(max_workers=_NUM_PARALLEL) as executor:
+        futures = {
+            executor.submit(_generate_one, file_info, ollama_host, model, test_dir): file_info
+            for file_info in targets
+        }
+        for future in as_completed(futures):
+            if future.result():
+                generated_count += 1
+
     print(f":: Fast generation completed: {generated_count} files")
     return generated_count
 
+
+# Delimits the per-module sections the batched prompt asks for
+_BATCH_SPLIT_RE = re.compile(r'(?m)^### FILE: (\S+)')
+
+
+def _generate_batched(targets: List[Dict[str, Any]], ollama_host: str,
+                      model: str, test_dir: Path) -> int:
+    """Generate tests for all targets in one request; returns file count.
+
+    Packs every module into a single prompt so the prefix tokens are
+    evaluated once for the whole batch instead of once per file.
+    """
+    prompt = (PROMPT_PREFIX +
+              "For each module below, output a ```python block preceded by a "
+              "line '### FILE: <module>'.\n")
+    for file_info in targets:
+        module = file_info.get("module", "")
+        prompt += f"\nTarget module: {module} (import with: from {module} import *)"
+    prompt += "\n\nTests:"
+
+    try:
+        response = SESSION.post(
+            f"{ollama_host}/api/generate",
+            data=_json_dumps({
+                "model": model,
+                "prompt": prompt,
+                "stream": False,
+                "keep_alive": "10m",
+                "options": {
+                    "temperature": 0.0,
+                    "top_p": 0.8,
+                    "num_ctx": 8192,                     # Fits the whole batch
+                    "num_predict": 500 * len(targets),   # Budget per module
+                    "num_keep": _PREFIX_TOKENS,
+                }
+            }),
+            headers=_JSON_HEADERS,
+            timeout=30 * len(targets)
+        )
+    except requests.exceptions.Timeout:
+        print(f":: ⏰ Timeout for batched generation")
+        return 0
+    except Exception as e:
+        print(f":: 💥 Error for batched generation: {e}")
+        return 0
+
+    if response.status_code != 200:
+        print(f":: ❌ API error: {response.status_code}")
+        return 0
+
+    text = _json_loads(response.content).get("response", "")
+    generated_count = 0
+    # The FILE tokens are model output; only honor the modules we
+    # actually asked for so an echoed path can't escape test_dir
+    requested = {f.get("module", "") for f in targets} - {""}
+    parts = _BATCH_SPLIT_RE.split(text)
+    # parts alternates [preamble, module, body, module, body, ...]
+    for module, body in zip(parts[1::2], parts[2::2]):
+        if module not in requested:
+            print(f":: ❌ Ignoring unrequested module in response: {module}")
+            continue
+
+        if "```python" in body:
+            code = body.split("```python")[1].split("```")[0].strip()
+        elif "```" in body:
+            code = body.split("```")[1].strip()
+        else:
+            code = body.strip()
+
+        if code and "def test_" in code:
+            try:
+                module_name = module.split('.')[-1]
+                test_file = test_dir / f"test_{module_name}_fast.py"
+                test_file.write_text(code, encoding='utf-8')
+            except Exception as e:
+                # One bad section must not abort the rest of the batch
+                print(f":: 💥 Error saving tests for {module}: {e}")
+                continue
+            print(f":: ✅ Generated {test_file}")
+            generated_count += 1
+        else:
+            print(f":: ❌ No valid tests for {module}")
+
+    return generated_count
+
+
+def _generate_one(file_info: Dict[str, Any], ollama_host: str, model: str,
+                  test_dir: Path) -> bool:
+    """Generate and save tests for one file; returns True on success."""
+    print(f":: Fast generating for {file_info['file']}...")
+
+    # Create minimal prompt
+    prompt = generate_minimal_prompt(file_info)
+
+    module_name = file_info['module'].split('.')[-1]
+    test_file = test_dir / f"test_{module_name}_fast.py"
+
+    # Identical prompt + model + options → identical response; serve it
+    # from disk instead of paying the LLM call again
+    cache_key = _response_cache_key(model, prompt)
+    cached_code = _response_cache_get(cache_key)
+    if cached_code is not None:
+        test_file.write_text(cached_code, encoding='utf-8')
+        print(f":: ⚡ Cache hit for {file_info['file']} -> {test_file}")
+        return True
+
+    try:
+        # Fast generation with tight constraints. Streaming lets us bail
+        # out as soon as the model closes its code fence instead of
+        # waiting for the server to buffer the full 500-token response.
+        with SESSION.post(
+            f"{ollama_host}/api/generate",
+            data=_json_dumps({
+                "model": model,
+                "prompt": prompt,
+                "stream": True,
+                "keep_alive": "10m",       # Keep model + prefix KV-cache warm
+                "options": {
+                    "temperature": 0.0,    # Deterministic
+                    "top_p": 0.8,
+                    "num_ctx": 2048,       # Very small context
+                    "num_predict": 500,    # Limit output length
+                    "num_keep": _PREFIX_TOKENS,  # Pin the shared prefix
+                    "stop": _STOP  # Stop early
+                }
+            }),
+            headers=_JSON_HEADERS,
+            stream=True,
+            timeout=30  # Short timeout
+        ) as response:
+            chunks: List[str] = []
+            if response.status_code == 200:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    obj = _json_loads(line)
+                    chunks.append(obj.get("response", ""))
+                    if obj.get("done") or _should_stop("".join(chunks)):
+                        break
+
+        if response.status_code == 200:
+            generated_code = "".join(chunks).strip()
+
+            # Clean markdown
+            if "```python" in generated_code:
+                generated_code = generated_code.split("```python")[1].split("```")[0].strip()
+            elif "```" in generated_code:
+                generated_code = generated_code.split("```")[1].strip()
+
+            if generated_code and "def test_" in generated_code:
+                # Save test file and remember the cleaned code for reruns
+                _response_cache_put(cache_key, generated_code)
+                test_file.write_text(generated_code, encoding='utf-8')
+                print(f":: ✅ Generated {test_file}")
+                return True
+            else:
+                print(f":: ❌ No valid tests for {file_info['file']}")
+        else:
+            print(f":: ❌ API error: {response.status_code}")
+
+    except requests.exceptions.Timeout:
+        print(f":: ⏰ Timeout for {file_info['file']}")
+    except Exception as e:
+        print(f":: 💥 Error for {file_info['file']}: {e}")
+
+    return False
+
 def main():
     """Main fast generation workflow."""
     # Import lightweight context builder
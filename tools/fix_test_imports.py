@@ -9,17 +9,42 @@ This script addresses common issues with LLM-generated test files:
 4. Path resolution issues
 """
 
+import functools
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
+# Outdated LangChain imports: the class name decides which modern
+# package it moved to, so one alternation rewrites them all in a single
+# pass instead of scanning the file once per pattern
+LC_MAP = {
+    'OpenAIEmbeddings': 'langchain_openai',
+    'OpenAI': 'langchain_openai',
+    'ChatOpenAI': 'langchain_openai',
+    'Chroma': 'langchain_community.vectorstores',
+}
+LC_RE = re.compile(
+    r'from langchain(?:\.embeddings|\.llms|\.chat_models|\.vectorstores)'
+    r' import (OpenAIEmbeddings|OpenAI|ChatOpenAI|Chroma)'
+)
+
 class TestImportFixer:
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
         self.fixes_applied = []
-        
+        # Compile every fixed pattern once: fix_import_paths runs per
+        # test file, and per-call re.search/re.sub pays a cache lookup
+        # (and recompile risk) for each pattern on each file.
+        self._src_re = re.compile(r'from src\.([a-zA-Z_][a-zA-Z0-9_]*) import')
+        self._local_module_re = None  # built lazily from _find_local_modules()
+        self._import_end_re = re.compile(r'(?m)^(?!\s*(?:import |from |$))')
+        self._screen_markers = None  # byte markers; built with the module list
+        self._fixes_lock = threading.Lock()
+
     def find_test_files(self, test_dirs: List[str] = None) -> List[Path]:
         """Find all test files in specified directories"""
         if test_dirs is None:
@@ -29,97 +54,92 @@ class TestImportFixer:
         for test_dir in test_dirs:
             test_path = self.project_root / test_dir
             if test_path.exists():
-                test_files.extend(test_path.rglob("test_*.py"))
-                test_files.extend(test_path.rglob("*_test.py"))
-        
+                # One recursive walk with a name filter instead of two
+                # rglob passes over the same tree
+                for path in test_path.rglob("*.py"):
+                    name = path.name
+                    if name.startswith("test_") or name.endswith("_test.py"):
+                        test_files.append(path)
+
         return test_files
     
     def fix_import_paths(self, file_path: Path) -> bool:
         """Fix common import path issues in a test file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+            data = file_path.read_bytes()
+
+            # Cheap byte-level screen: if none of the markers any fix
+            # looks for appear, skip the decode and regex work entirely.
+            # Most files are clean after the first run.
+            if self._screen_markers is None:
+                self._screen_markers = (
+                    b'from src.', b'langchain.', b'pytest.',
+                    *(f'from {m} import'.encode('utf-8') for m in self._local_modules),
+                )
+            if not any(marker in data for marker in self._screen_markers):
+                return False
+
+            content = data.decode('utf-8')
             original_content = content
             fixes_made = []
             
             # Fix 1: Remove non-existent src imports
             if not (self.project_root / "src").exists():
                 # Replace 'from src.module import ...' with 'from module import ...'
-                pattern = r'from src\.([a-zA-Z_][a-zA-Z0-9_]*) import'
-                replacement = r'from \1 import'
-                if re.search(pattern, content):
-                    content = re.sub(pattern, replacement, content)
+                content, n = self._src_re.subn(r'from \1 import', content)
+                if n:
                     fixes_made.append("Removed 'src.' prefix from imports")
-            
+
             # Fix 2: Update LangChain imports
-            langchain_fixes = [
-                (r'from langchain\.embeddings import OpenAIEmbeddings', 
-                 'from langchain_openai import OpenAIEmbeddings'),
-                (r'from langchain\.llms import OpenAI', 
-                 'from langchain_openai import OpenAI'),
-                (r'from langchain\.chat_models import ChatOpenAI', 
-                 'from langchain_openai import ChatOpenAI'),
-                (r'from langchain\.vectorstores import Chroma', 
-                 'from langchain_community.vectorstores import Chroma'),
-            ]
-            
-            for old_import, new_import in langchain_fixes:
-                if re.search(old_import, content):
-                    content = content.replace(old_import, new_import)
-                    fixes_made.append(f"Updated LangChain import: {old_import}")
+            content, n = LC_RE.subn(
+                lambda m: f'from {LC_MAP[m.group(1)]} import {m.group(1)}', content)
+            if n:
+                fixes_made.append(f"Updated {n} LangChain import(s)")
             
             # Fix 3: Add missing pytest import
             if 'import pytest' not in content and 'pytest.' in content:
-                # Add pytest import after other imports
-                import_section = []
-                other_lines = []
-                in_imports = True
-                
-                for line in content.split('\n'):
-                    if line.strip().startswith(('import ', 'from ')) and in_imports:
-                        import_section.append(line)
-                    elif line.strip() == '' and in_imports:
-                        import_section.append(line)
-                    else:
-                        if in_imports and line.strip():
-                            import_section.append('import pytest')
-                            import_section.append('')
-                            in_imports = False
-                        other_lines.append(line)
-                
-                if in_imports:  # All lines were imports
-                    import_section.append('import pytest')
-                    import_section.append('')
-                
-                content = '\n'.join(import_section + other_lines)
+                # Splice the import in at the end of the leading import
+                # block (first line that is neither an import nor blank)
+                # with two slices instead of splitting the whole file
+                # into a line list and re-joining it
+                m = self._import_end_re.search(content)
+                idx = m.start() if m else len(content)
+                content = content[:idx] + 'import pytest\n\n' + content[idx:]
                 fixes_made.append("Added missing 'import pytest'")
             
             # Fix 4: Add PYTHONPATH imports for local modules
-            local_modules = self._find_local_modules()
-            for module in local_modules:
-                old_pattern = rf'from {module} import'
-                if re.search(old_pattern, content):
-                    # Add sys.path.insert if not already present
-                    if 'sys.path.insert' not in content:
-                        pytest_import_line = 'import pytest'
-                        if pytest_import_line in content:
-                            content = content.replace(
-                                pytest_import_line, 
-                                f'import sys\nimport os\nsys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))\n{pytest_import_line}'
-                            )
-                            fixes_made.append("Added sys.path configuration for local imports")
-                            break
+            if self._local_module_re is None:
+                local_modules = self._local_modules
+                # One alternation covering every local module instead of a
+                # fresh dynamic pattern per module per file
+                self._local_module_re = re.compile(
+                    'from (?:' + '|'.join(map(re.escape, local_modules)) + r') import'
+                ) if local_modules else re.compile(r'(?!)')
+            if self._local_module_re.search(content):
+                # Add sys.path.insert if not already present
+                if 'sys.path.insert' not in content:
+                    pytest_import_line = 'import pytest'
+                    if pytest_import_line in content:
+                        content = content.replace(
+                            pytest_import_line,
+                            f'import sys\nimport os\nsys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))\n{pytest_import_line}'
+                        )
+                        fixes_made.append("Added sys.path configuration for local imports")
             
-            # Write back if changes were made
+            # Write back if changes were made; tmp + rename keeps the
+            # test file whole if the process dies mid-write and leaves
+            # the mtime of untouched files alone for --lf-style tooling
             if content != original_content:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                self.fixes_applied.append({
-                    'file': str(file_path),
-                    'fixes': fixes_made
-                })
+                tmp_path = file_path.with_suffix('.py.tmp')
+                tmp_path.write_text(content, encoding='utf-8')
+                os.replace(tmp_path, file_path)
+
+
+                with self._fixes_lock:
+                    self.fixes_applied.append({
+                        'file': str(file_path),
+                        'fixes': fixes_made
+                    })
                 return True
             
             return False
@@ -128,21 +148,26 @@ class TestImportFixer:
             print(f"Error fixing {file_path}: {e}")
             return False
     
-    def _find_local_modules(self) -> List[str]:
-        """Find local Python modules that might be imported"""
+    @functools.cached_property
+    def _local_modules(self) -> List[str]:
+        """Local Python modules that might be imported.
+
+        Cached on the instance: fix_import_paths would otherwise rescan
+        the project root (iterdir + glob per child) for every test file.
+        """
         modules = []
-        
+
         # Check for common module directories
         for item in self.project_root.iterdir():
             if item.is_dir() and not item.name.startswith('.'):
-                if (item / '__init__.py').exists() or any(item.glob('*.py')):
+                if (item / '__init__.py').is_file() or next(item.glob('*.py'), None) is not None:
                     modules.append(item.name)
-        
+
         # Check for single Python files that might be modules
         for py_file in self.project_root.glob('*.py'):
             if not py_file.name.startswith('test_') and not py_file.name.endswith('_test.py'):
                 modules.append(py_file.stem)
-        
+
         return modules
     
     def fix_all_tests(self, test_dirs: List[str] = None) -> dict:
@@ -156,15 +181,25 @@ class TestImportFixer:
             'fixes_applied': []
         }
         
-        for test_file in test_files:
+        # Warm the per-instance caches before fanning out so the worker
+        # threads only read them
+        _ = self._local_modules
+
+        # Each file is independent I/O plus regex work; a thread pool
+        # overlaps the file reads and keeps ordering via map
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4))) as executor:
+            outcomes = list(executor.map(self.fix_import_paths, test_files))
+
+        # Report after the join so output isn't interleaved
+        for test_file, fixed in zip(test_files, outcomes):
             print(f"Checking {test_file}...")
-            if self.fix_import_paths(test_file):
+            if fixed:
                 results['files_fixed'] += 1
                 print(f"  ✅ Fixed imports in {test_file}")
             else:
                 results['files_skipped'] += 1
                 print(f"  ⏭️  No fixes needed for {test_file}")
-        
+
         results['fixes_applied'] = self.fixes_applied
         return results
 
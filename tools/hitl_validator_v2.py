@@ -44,7 +44,19 @@ class HITLValidator:
     def __init__(self):
         self.artifacts_dir = ARTIFACTS
         self.artifacts_dir.mkdir(exist_ok=True)
-        
+
+    def _append_to_index(self, review_id: str, status: str) -> None:
+        """Record a review status change in the append-only index.
+
+        The index lets consumers (e.g. the evaluation harness) answer
+        "which reviews are approved?" from one small file instead of
+        globbing and parsing every hitl_review_*.json artifact. The
+        latest line per id wins.
+        """
+        index_path = self.artifacts_dir / "hitl_index.jsonl"
+        with index_path.open('a', encoding='utf-8') as f:
+            f.write(json.dumps({"id": review_id, "status": status}) + "\n")
+
     def create_review_artifact(self, 
                              generated_tests: List[Dict[str, Any]],
                              context: Dict[str, Any]) -> str:
@@ -100,7 +112,8 @@ class HITLValidator:
         # Save artifact
         artifact_path = self.artifacts_dir / f"hitl_review_{review_artifact['id']}.json"
         artifact_path.write_text(json.dumps(review_artifact, indent=2))
-        
+        self._append_to_index(review_artifact["id"], review_artifact["status"])
+
         # Create human-readable review file
         self._create_human_review_file(review_artifact, artifact_path.with_suffix('.md'))
         
@@ -306,7 +319,8 @@ python tools/policy_checker_v2.py tests/generated/ --format json > policy_check.
             
             # Save updated artifact
             artifact_path.write_text(json.dumps(artifact, indent=2))
-            
+            self._append_to_index(review_id, "approved")
+
             print(f"✅ Review {review_id} approved by {reviewer_name}")
             return True
             
@@ -337,7 +351,8 @@ python tools/policy_checker_v2.py tests/generated/ --format json > policy_check.
                 item["reviewer_notes"] = reason
             
             artifact_path.write_text(json.dumps(artifact, indent=2))
-            
+            self._append_to_index(review_id, "rejected")
+
             print(f"❌ Review {review_id} rejected by {reviewer_name}")
             print(f"   Reason: {reason}")
             return True
@@ -40,6 +40,13 @@ class TestPolicyChecker:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or self.default_config()
         self.violations: List[PolicyViolation] = []
+        # Compile once at construction; the forbidden patterns run against
+        # every line of every checked file
+        self._forbidden_res = [re.compile(p) for p in self.config["forbidden_patterns"]]
+        self._required_res = {
+            lang: [re.compile(p) for p in patterns]
+            for lang, patterns in self.config["required_patterns"].items()
+        }
         
     def default_config(self) -> Dict[str, Any]:
         """Default policy configuration."""
@@ -133,15 +140,15 @@ class TestPolicyChecker:
         """Check for forbidden patterns that make tests flaky or unsafe."""
         violations = []
         
-        for pattern in self.config["forbidden_patterns"]:
+        for pattern in self._forbidden_res:
             for line_num, line in enumerate(lines, 1):
-                if re.search(pattern, line):
+                if pattern.search(line):
                     violations.append(PolicyViolation(
                         file_path=str(file_path),
                         line=line_num,
                         rule="forbidden_pattern",
                         severity="error",
-                        message=f"Forbidden pattern '{pattern}' found",
+                        message=f"Forbidden pattern '{pattern.pattern}' found",
                         code_snippet=line.strip()
                     ))
         
@@ -232,8 +239,8 @@ class TestPolicyChecker:
         
         # Check for test framework patterns
         has_test_framework = False
-        for pattern in self.config["required_patterns"]["javascript"]:
-            if re.search(pattern, content):
+        for pattern in self._required_res["javascript"]:
+            if pattern.search(content):
                 has_test_framework = True
                 break
         
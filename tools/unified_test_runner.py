@@ -32,6 +32,15 @@ ARTIFACTS.mkdir(exist_ok=True)
 
 # Global flags
 AUTO_APPROVE_TESTS = False
+PARALLEL_WORKERS = "auto"  # --parallel/-j; "auto" = cpu_count - 2
+
+
+def worker_count() -> int:
+    """Resolve the --parallel setting to a concrete worker count."""
+    if PARALLEL_WORKERS != "auto":
+        return max(1, int(PARALLEL_WORKERS))
+    # Leave two cores for the runner itself and the OS
+    return max(1, (os.cpu_count() or 2) - 2)
 
 def run(cmd: str, cwd: Optional[pathlib.Path] = None, allow_fail: bool = False, 
         env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -134,7 +143,8 @@ def ensure_deps(stack: str) -> List[Dict[str, Any]]:
         cmds = [
             "python -m pip install -U pip",
             "if [ -f requirements.txt ]; then python -m pip install -r requirements.txt; fi",
-            "if [ -f pyproject.toml ]; then python -m pip install .; fi"
+            "if [ -f pyproject.toml ]; then python -m pip install .; fi",
+            "python -m pip install pytest-xdist"  # Parallel test sharding
         ]
     elif stack == "node":
         cmds = [
@@ -370,31 +380,40 @@ Output only Python code, no explanations or markdown:"""
 
 def run_native_tests(stack: str) -> Dict[str, Any]:
     """Run native test framework based on detected stack."""
-    
+    workers = worker_count()
+
     if stack == "python":
-        # Try pytest first, fallback to unittest
-        cmd = ("python -m pytest -v --tb=short --maxfail=5 "
+        # Try pytest first, fallback to unittest. With more than one
+        # worker, shard test files across cores via pytest-xdist
+        # (loadfile keeps a file's tests on one worker); coverage's
+        # parallel mode combines the per-worker data into coverage.xml.
+        xdist = f"-n {workers} --dist=loadfile " if workers > 1 else ""
+        cmd = (f"python -m pytest -v --tb=short --maxfail=5 {xdist}"
                "--cov=. --cov-report=xml:coverage.xml --cov-report=term "
                "--junitxml=test-results.xml || "
                "python -m unittest discover -v || true")
-        
+
     elif stack == "node":
         # Check if npm test script exists, otherwise try jest directly
+        jest_workers = (f"--maxWorkers={workers}" if workers > 1
+                        else "--runInBand")
         cmd = ("if npm run | grep -q 'test$'; then npm test; "
-               "else npx jest --verbose --runInBand --coverage "
+               f"else npx jest --verbose {jest_workers} --coverage "
                "--coverageReporters=text --coverageReporters=lcov "
                "--testResultsProcessor=jest-junit || true; fi")
-        
+
     elif stack == "java":
         # Maven first, then Gradle
-        cmd = ("if [ -f pom.xml ]; then mvn -B test "
+        maven_parallel = (f"-T {workers} -DforkCount={workers} "
+                          "-DreuseForks=true " if workers > 1 else "")
+        cmd = (f"if [ -f pom.xml ]; then mvn -B test {maven_parallel}"
                "-Dmaven.test.failure.ignore=true || true; "
                "elif [ -f build.gradle ]; then ./gradlew --no-daemon test "
                "--continue || true; fi")
-        
+
     else:
         cmd = "echo 'Unknown stack; no native tests run'"
-    
+
     return run(cmd, allow_fail=True)
 
 def collect_reports(stack: str) -> List[str]:
@@ -560,21 +579,24 @@ def main():
 
 def parse_args_and_run():
     """Parse command line arguments and run the main function."""
-    global AUTO_APPROVE_TESTS
-    
+    global AUTO_APPROVE_TESTS, PARALLEL_WORKERS
+
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="GenAI Test Platform - Unified Test Runner")
     parser.add_argument("--target-function", help="Target function for test generation")
     parser.add_argument("--files", help="Target files for test generation")
-    parser.add_argument("--auto-approve", action="store_true", 
+    parser.add_argument("--auto-approve", action="store_true",
                        help="Automatically approve all generated tests (skip human review)")
-    
+    parser.add_argument("--parallel", "-j", default="auto",
+                       help="Test workers: a number, or 'auto' for cpu_count-2 (1 disables parallelism)")
+
     args = parser.parse_args()
-    
-    # Set global flag for auto-approval
+
+    # Set global flags
     AUTO_APPROVE_TESTS = args.auto_approve
-    
+    PARALLEL_WORKERS = args.parallel
+
     main()
 
 if __name__ == "__main__":